@@ -14,6 +14,9 @@ from pathlib import Path
 # Add src to path for demonstration purposes
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Address prefixes flagged as vanity addresses (same heuristic as Web3ThreatIntelligenceTool)
+VANITY_ADDRESS_PREFIXES = ("0x000000", "0xffffff", "0xdeadbeef", "0xcafebabe", "0xbadc0de")
+
 
 def demo_smart_contract_analysis():
     """Demonstrate smart contract vulnerability analysis."""
@@ -129,7 +132,7 @@ def demo_threat_intelligence():
         print(f"Type: {description}")
         print("-" * 80)
 
-        if "00000000" in address:
+        if address.lower().startswith(VANITY_ADDRESS_PREFIXES):
             print("  ⚠️  Suspicious Pattern: Vanity address detected")
             print("     → Possible impersonation attempt")
             print("     → Threat Level: LOW")
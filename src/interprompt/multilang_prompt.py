@@ -10,6 +10,9 @@ from .jinja_template import JinjaTemplate, ParameterizedTemplateInterface
 
 log = logging.getLogger(__name__)
 
+# the libyaml-based safe loader, falling back to the pure-Python one if PyYAML was built without libyaml
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PromptTemplate(ToStringMixin, ParameterizedTemplateInterface):
     def __init__(self, name: str, jinja_template_string: str) -> None:
@@ -314,7 +317,7 @@ class MultiLangPromptCollection:
                 continue
             path = os.path.join(prompts_dir, fn)
             with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_SAFE_LOADER)
             try:
                 prompts_data = data["prompts"]
             except KeyError as e:
@@ -7,10 +7,13 @@ from collections import defaultdict
 from copy import copy
 from dataclasses import asdict, dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from anthropic.types import MessageParam, MessageTokensCount
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from anthropic.types import MessageTokensCount
+
 log = logging.getLogger(__name__)
 
 
@@ -60,6 +63,8 @@ class AnthropicTokenCount(TokenCountEstimator):
         self._anthropic_client = anthropic.Anthropic(api_key=api_key)
 
     def _send_count_tokens_request(self, text: str) -> MessageTokensCount:
+        from anthropic.types import MessageParam
+
         return self._anthropic_client.messages.count_tokens(
             model=self._model_name,
             messages=[MessageParam(role="user", content=text)],
@@ -7,7 +7,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
-import yaml
 from sensai.util import logging
 from sensai.util.string import ToStringMixin
 
@@ -20,6 +19,7 @@ from serena.constants import (
     SERENAS_OWN_CONTEXT_YAMLS_DIR,
     SERENAS_OWN_MODE_YAMLS_DIR,
 )
+from serena.util.general import load_yaml_safe
 
 if TYPE_CHECKING:
     pass
@@ -61,7 +61,7 @@ class SerenaAgentMode(ToolInclusionDefinition, ToStringMixin):
         """Load a mode from a YAML file."""
         yaml_as_path = Path(yaml_path).resolve()
         with Path(yaml_as_path).open(encoding=SERENA_FILE_ENCODING) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml_safe(f)
         name = data.pop("name", yaml_as_path.stem)
         return cls(name=name, _yaml_path=yaml_as_path, **data)
 
@@ -183,7 +183,7 @@ class SerenaAgentContext(ToolInclusionDefinition, ToStringMixin):
         """Load a context from a YAML file."""
         yaml_as_path = Path(yaml_path).resolve()
         with yaml_as_path.open(encoding=SERENA_FILE_ENCODING) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml_safe(f)
         name = data.pop("name", yaml_as_path.stem)
         # Ensure backwards compatibility for tool_description_overrides
         if "tool_description_overrides" not in data:
@@ -14,7 +14,6 @@ from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Self, TypeVar
 
-import yaml
 from ruamel.yaml.comments import CommentedMap
 from sensai.util import logging
 from sensai.util.logging import LogTime, datetime_tag
@@ -29,7 +28,7 @@ from serena.constants import (
     SERENA_MANAGED_DIR_IN_HOME,
     SERENA_MANAGED_DIR_NAME,
 )
-from serena.util.general import load_yaml, save_yaml, get_dataclass_default
+from serena.util.general import get_dataclass_default, load_yaml, load_yaml_safe, save_yaml
 from serena.util.inspection import determine_programming_language_composition
 from solidlsp.ls_config import Language
 
@@ -220,7 +219,7 @@ class ProjectConfig(ToolInclusionDefinition, ToStringMixin):
                         f"Supported languages are: {language_values}\n"
                         f"Read the documentation for more information."
                     )
-# sort languages by number of files found
+                # sort languages by number of files found
                 languages_and_percentages = sorted(language_composition.items(), key=lambda item: item[1], reverse=True)
                 # find the language with the highest percentage and enable it
                 top_language_pair = languages_and_percentages[0]
@@ -618,7 +617,7 @@ class SerenaConfig(ToolInclusionDefinition, ToStringMixin):
         log.info(f"Found legacy project configuration file {path}, migrating to in-project configuration.")
         try:
             with open(path, encoding=SERENA_FILE_ENCODING) as f:
-                project_config_data = yaml.safe_load(f)
+                project_config_data = load_yaml_safe(f)
             if "project_name" not in project_config_data:
                 project_name = path.stem
                 with open(path, "a", encoding=SERENA_FILE_ENCODING) as f:
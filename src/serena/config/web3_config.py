@@ -2,11 +2,21 @@
 Web3 configuration settings for blockchain analysis and security scanning.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cache
 from typing import Any
 
 
-@dataclass
+def _copy_config_value(value: Any) -> Any:
+    """Copies the (possibly nested) containers of a configuration value, leaving the scalars shared."""
+    if isinstance(value, dict):
+        return {k: _copy_config_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_config_value(v) for v in value]
+    return value
+
+
+@dataclass(slots=True)
 class Web3Config:
     """Configuration for Web3 vulnerability hunting tools."""
 
@@ -77,29 +87,18 @@ class Web3Config:
     enable_cache: bool = True
     cache_ttl_seconds: int = 3600
 
+    @classmethod
+    @cache
+    def _field_names(cls) -> frozenset[str]:
+        return frozenset(f.name for f in fields(cls))
+
     @classmethod
     def from_dict(cls, config_dict: dict[str, Any]) -> "Web3Config":
-        """Create Web3Config from dictionary."""
-        return cls(**{k: v for k, v in config_dict.items() if k in cls.__annotations__})
+        """Create Web3Config from dictionary, ignoring unknown keys."""
+        field_names = cls._field_names()
+        return cls(**{k: v for k, v in config_dict.items() if k in field_names})
 
     def to_dict(self) -> dict[str, Any]:
         """Convert Web3Config to dictionary."""
-        return {
-            "ethereum_rpc_url": self.ethereum_rpc_url,
-            "polygon_rpc_url": self.polygon_rpc_url,
-            "bsc_rpc_url": self.bsc_rpc_url,
-            "arbitrum_rpc_url": self.arbitrum_rpc_url,
-            "optimism_rpc_url": self.optimism_rpc_url,
-            "etherscan_api_key": self.etherscan_api_key,
-            "blocksec_api_key": self.blocksec_api_key,
-            "chainanalysis_api_key": self.chainanalysis_api_key,
-            "default_severity_threshold": self.default_severity_threshold,
-            "max_transaction_lookback": self.max_transaction_lookback,
-            "enable_threat_intelligence": self.enable_threat_intelligence,
-            "smart_contract_analysis": self.smart_contract_analysis,
-            "defi_protocol_checks": self.defi_protocol_checks,
-            "transaction_analysis": self.transaction_analysis,
-            "threat_intel_sources": self.threat_intel_sources,
-            "enable_cache": self.enable_cache,
-            "cache_ttl_seconds": self.cache_ttl_seconds,
-        }
+        # equivalent to dataclasses.asdict for the plain values of this class, but without its generic recursion
+        return {f.name: _copy_config_value(getattr(self, f.name)) for f in fields(self)}
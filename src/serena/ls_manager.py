@@ -148,6 +148,15 @@ class LanguageServerManager:
             ls = self._default_language_server
         return self._ensure_functional_ls(ls)
 
+    def get_language_server_for_language(self, language: Language) -> SolidLanguageServer | None:
+        """
+        Returns the language server for the given language as is, i.e. without restarting it if it is not running.
+
+        :param language: the language
+        :return: the language server or None if no language server is managed for the given language
+        """
+        return self._language_servers.get(language)
+
     def _create_and_start_language_server(self, language: Language) -> SolidLanguageServer:
         if self._language_server_factory is None:
             raise ValueError(f"No language server factory available to create language server for {language}")
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -273,27 +274,46 @@ class Project(ToStringMixin):
             if self.is_ignored_path(relative_path):
                 raise ValueError(f"Path {relative_path} is ignored; cannot access for safety reasons")
 
-    def gather_source_files(self, relative_path: str = "") -> list[str]:
+    def gather_source_files(self, relative_path: str = "", extensions: Iterable[str] | None = None) -> list[str]:
         """Retrieves relative paths of all source files, optionally limited to the given path
 
         :param relative_path: if provided, restrict search to this path
+        :param extensions: if provided, only files whose names end with one of the given extensions (e.g. ".sol") are returned;
+            other files are skipped before the (comparatively expensive) ignore checks are applied
         """
+        extensions_tuple = tuple(extensions) if extensions is not None else None
         rel_file_paths = []
         start_path = os.path.join(self.project_root, relative_path)
         if not os.path.exists(start_path):
             raise FileNotFoundError(f"Relative path {start_path} not found.")
         if os.path.isfile(start_path):
+            if extensions_tuple is not None and not relative_path.endswith(extensions_tuple):
+                return []
             return [relative_path]
         else:
-            for root, dirs, files in os.walk(start_path, followlinks=True):
+            # paths produced by the walk below normally start with the root prefix, which allows us to obtain
+            # relative paths by slicing instead of going through Path.relative_to/os.path.relpath for every file
+            root_prefix = os.path.join(self.project_root, "")
+
+            def is_ignored(abs_path: str, ignore_non_source_files: bool = False) -> bool:
+                if abs_path.startswith(root_prefix):
+                    return self._is_ignored_relative_path(abs_path[len(root_prefix) :], ignore_non_source_files=ignore_non_source_files)
+                return self.is_ignored_path(abs_path, ignore_non_source_files=ignore_non_source_files)
+
+            for root, dirs, files in os.walk(os.path.normpath(start_path), followlinks=True):
                 # prevent recursion into ignored directories
-                dirs[:] = [d for d in dirs if not self.is_ignored_path(os.path.join(root, d))]
+                dirs[:] = [d for d in dirs if not is_ignored(os.path.join(root, d))]
 
                 # collect non-ignored files
                 for file in files:
+                    if extensions_tuple is not None and not file.endswith(extensions_tuple):
+                        continue
                     abs_file_path = os.path.join(root, file)
                     try:
-                        if not self.is_ignored_path(abs_file_path, ignore_non_source_files=True):
+                        if not is_ignored(abs_file_path, ignore_non_source_files=True):
+                            if abs_file_path.startswith(root_prefix):
+                                rel_file_paths.append(abs_file_path[len(root_prefix) :])
+                                continue
                             try:
                                 rel_file_path = os.path.relpath(abs_file_path, start=self.project_root)
                             except Exception:
@@ -2,13 +2,34 @@
 Diagnostic tools for checking language server status and Web3 language server availability.
 """
 
-import json
 import shutil
 from typing import Any
 
 from serena.tools import Tool, ToolMarkerOptional
 from solidlsp.ls_config import Language
 
+# maps the file extensions of Web3 languages to the keys used by DetectWeb3LanguagesTool
+_WEB3_EXTENSION_TO_LANGUAGE_KEY = {
+    ".rs": "rust_soroban",
+    ".sol": "solidity",
+    ".vy": "vyper",
+    ".cairo": "cairo",
+    ".move": "move",
+}
+
+# executable paths found by _which; misses are not cached so that servers installed in the meantime are detected
+_which_cache: dict[str, str] = {}
+
+
+def _which(executable: str) -> str | None:
+    """Like shutil.which, but remembers the paths of executables that were found."""
+    path = _which_cache.get(executable)
+    if path is None:
+        path = shutil.which(executable)
+        if path is not None:
+            _which_cache[executable] = path
+    return path
+
 
 class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
     """
@@ -34,7 +55,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         project = self.agent.get_active_project()
         if project is None:
             result["error"] = "No active project. Activate a project first."
-            return json.dumps(result, indent=2)
+            return self._to_json(result)
 
         # Get configured languages
         configured_languages = [lang.value for lang in project.project_config.languages]
@@ -57,7 +78,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
             # Check which servers are running
             for language in project.project_config.languages:
                 try:
-                    ls = ls_manager.get_language_server(relative_path="")
+                    ls = ls_manager.get_language_server_for_language(language)
                     if ls is not None and ls.is_running():
                         result["servers_running"].append(language.value)
                     else:
@@ -68,7 +89,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         # Add installation instructions for common Web3 language servers
         result["installation_instructions"] = self._get_web3_ls_installation_instructions()
 
-        return json.dumps(result, indent=2)
+        return self._to_json(result)
 
     def _get_web3_ls_installation_instructions(self) -> dict[str, dict[str, Any]]:
         """
@@ -79,7 +100,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         instructions = {}
 
         # Check for rust-analyzer (Rust/Soroban)
-        rust_analyzer_path = shutil.which("rust-analyzer")
+        rust_analyzer_path = _which("rust-analyzer")
         instructions["rust"] = {
             "language_server": "rust-analyzer",
             "installed": rust_analyzer_path is not None,
@@ -90,7 +111,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         }
 
         # Check for solidity-language-server (Solidity)
-        solidity_ls_path = shutil.which("solidity-language-server")
+        solidity_ls_path = _which("solidity-language-server")
         instructions["solidity"] = {
             "language_server": "solidity-language-server",
             "installed": solidity_ls_path is not None,
@@ -100,7 +121,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         }
 
         # Check for cairo-language-server (Cairo/Starknet)
-        cairo_ls_path = shutil.which("cairo-language-server")
+        cairo_ls_path = _which("cairo-language-server")
         instructions["cairo"] = {
             "language_server": "cairo-language-server",
             "installed": cairo_ls_path is not None,
@@ -110,7 +131,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         }
 
         # Check for move-analyzer (Move/Aptos/Sui)
-        move_analyzer_path = shutil.which("move-analyzer")
+        move_analyzer_path = _which("move-analyzer")
         instructions["move"] = {
             "language_server": "move-analyzer",
             "installed": move_analyzer_path is not None,
@@ -120,7 +141,7 @@ class CheckLanguageServerStatusTool(Tool, ToolMarkerOptional):
         }
 
         # Check for vyper-lsp (Vyper)
-        vyper_lsp_path = shutil.which("vyper-lsp")
+        vyper_lsp_path = _which("vyper-lsp")
         instructions["vyper"] = {
             "language_server": "vyper-lsp",
             "installed": vyper_lsp_path is not None,
@@ -146,7 +167,7 @@ class DetectWeb3LanguagesTool(Tool, ToolMarkerOptional):
         """
         project = self.agent.get_active_project()
         if project is None:
-            return json.dumps({"error": "No active project. Activate a project first."})
+            return self._to_json({"error": "No active project. Activate a project first."})
 
         detected_languages = {
             "rust_soroban": False,
@@ -158,30 +179,21 @@ class DetectWeb3LanguagesTool(Tool, ToolMarkerOptional):
 
         # Gather source files
         try:
-            source_files = project.gather_source_files()
-
-            # Detect Rust/Soroban
-            if any(f.endswith(".rs") for f in source_files):
-                detected_languages["rust_soroban"] = True
-
-            # Detect Solidity
-            if any(f.endswith(".sol") for f in source_files):
-                detected_languages["solidity"] = True
-
-            # Detect Vyper
-            if any(f.endswith(".vy") for f in source_files):
-                detected_languages["vyper"] = True
-
-            # Detect Cairo
-            if any(f.endswith(".cairo") for f in source_files):
-                detected_languages["cairo"] = True
-
-            # Detect Move
-            if any(f.endswith(".move") for f in source_files):
-                detected_languages["move"] = True
+            source_files = project.gather_source_files(extensions=_WEB3_EXTENSION_TO_LANGUAGE_KEY.keys())
+
+            # Detect all languages in a single pass, stopping as soon as every language has been seen
+            for f in source_files:
+                ext_start = f.rfind(".")
+                if ext_start == -1:
+                    continue
+                language_key = _WEB3_EXTENSION_TO_LANGUAGE_KEY.get(f[ext_start:])
+                if language_key is not None and not detected_languages[language_key]:
+                    detected_languages[language_key] = True
+                    if all(detected_languages.values()):
+                        break
 
         except Exception as e:
-            return json.dumps({"error": f"Failed to gather source files: {e}"})
+            return self._to_json({"error": f"Failed to gather source files: {e}"})
 
         result: dict[str, Any] = {
             "project": project.project_name,
@@ -206,4 +218,4 @@ class DetectWeb3LanguagesTool(Tool, ToolMarkerOptional):
         if detected_languages["move"]:
             result["recommendations"].append("Ensure move-analyzer is installed for Move/Aptos/Sui support")
 
-        return json.dumps(result, indent=2)
+        return self._to_json(result)
@@ -7,10 +7,17 @@ including oracle manipulation, governance exploits, vault accounting errors, com
 MEV attacks, upgrade flaws, and economic edge cases that require deep logic analysis.
 """
 
-import json
+import hashlib
+import itertools
+import multiprocessing
+import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Literal, TypedDict
+from typing import Any, Generic, Literal, TypedDict, TypeVar
 
 from serena.tools import Tool
 
@@ -47,6 +54,189 @@ class ThreatFinding(TypedDict, total=False):
     details: str  # Additional details
 
 
+_RE_ASSIGNMENT = re.compile(r"\w+\s*=\s*")
+_RE_PRAGMA_SOLIDITY = re.compile(r"pragma solidity\s+([^;]+);")
+_RE_VERSION = re.compile(r"[\^~]?(\d+)\.(\d+)\.(\d+)")
+_RE_ARITHMETIC = re.compile(r"[\+\-\*](?!=)")
+_RE_PUBLIC_FUNCTION_SIGNATURE = re.compile(r"function\s+\w+\s*\([^)]*\)\s+(public|external)")
+_RE_PUBLIC_FUNCTION = re.compile(r"function\s+\w+.*\b(public|external)\b")
+_RE_PROTECTING_MODIFIER = re.compile(r"(onlyOwner|onlyRole|requiresAuth|nonReentrant|whenNotPaused|modifier)")
+_RE_VIEW_OR_PURE = re.compile(r"\b(view|pure)\b")
+_RE_COMMENTED_DELEGATECALL = re.compile(r"//.*delegatecall")
+_RE_CHECKED_CALL = re.compile(r"(require|assert|if)\s*\(.*\.(call|send)")
+_RE_FLASH_LOAN_KEYWORD = re.compile(r"flashloan|borrow|repay")
+# matched against lowercased content (which is cheaper than matching case-insensitively)
+_RE_COLLATERAL_FACTOR = re.compile(r"collateral.*factor[\"']?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)")
+_RE_REWARD_RATE = re.compile(r"reward.*rate[\"']?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)")
+_RE_ADDRESS = re.compile(r"^0x[a-fA-F0-9]{40}$")
+# details of the findings reported for addresses starting with suspicious (vanity) patterns, by (lowercase) hex prefix
+_VANITY_ADDRESS_PREFIXES = {
+    "000000": "Address has suspicious leading zeros",
+    "ffffff": "Address has suspicious leading F's",
+    "deadbeef": "Address starts with the vanity pattern 'deadbeef'",
+    "cafebabe": "Address starts with the vanity pattern 'cafebabe'",
+    "badc0de": "Address starts with the vanity pattern 'badc0de'",
+}
+# the lengths of the prefixes above, such that an address is looked up once per length rather than once per prefix
+_VANITY_ADDRESS_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _VANITY_ADDRESS_PREFIXES}))
+
+
+_DEFAULT_VULNERABILITY_TYPES = (
+    "reentrancy",
+    "overflow",
+    "unprotected_functions",
+    "tx_origin",
+    "delegatecall",
+    "timestamp_dependence",
+    "unchecked_calls",
+    "access_control",
+)
+_DEFAULT_TRANSACTION_CHECK_TYPES = ("mev", "flash_loan", "unusual_gas", "suspicious_calls", "token_approval")
+
+_SEVERITY_LEVELS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+_THREAT_LEVELS = {"none": 0, **_SEVERITY_LEVELS}
+
+# (severity, description, recommendation) of the findings reported by each of the checks of AnalyzeSmartContractTool.
+# The checks only determine the lines on which they report a finding; the findings are built from these templates.
+_FINDING_TEMPLATES: dict[str, tuple[Literal["low", "medium", "high", "critical"], str, str]] = {
+    "reentrancy": (
+        "high",
+        "Potential reentrancy vulnerability: state change after external call",
+        "Use checks-effects-interactions pattern or ReentrancyGuard",
+    ),
+    "overflow": (
+        "medium",
+        "Potential integer overflow/underflow without SafeMath",
+        "Use SafeMath library or upgrade to Solidity 0.8.0+",
+    ),
+    "unprotected_functions": (
+        "high",
+        "Public/external function without access control modifier",
+        "Add appropriate access control modifiers (e.g., onlyOwner)",
+    ),
+    "tx_origin": ("high", "Use of tx.origin for authorization", "Use msg.sender instead of tx.origin"),
+    "delegatecall": (
+        "critical",
+        "Delegatecall to untrusted contract can lead to complete contract takeover",
+        "Ensure delegatecall target is trusted and immutable",
+    ),
+    "timestamp_dependence": (
+        "medium",
+        "Reliance on block.timestamp or block.number",
+        "Avoid using block.timestamp for critical logic; miners can manipulate it",
+    ),
+    "unchecked_calls": (
+        "high",
+        "Unchecked return value from external call",
+        "Always check return values from .call() and .send()",
+    ),
+    "access_control": ("medium", "Contract lacks access control mechanism", "Implement Ownable or AccessControl pattern"),
+}
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class _LRUCache(Generic[_K, _V]):
+    """
+    A thread-safe cache which evicts the least recently used entries beyond a maximum size.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> _V | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# analysis results, keyed by (digest of the contract content, enabled checks);
+# the results are stored as (check, line) pairs
+_analysis_cache: _LRUCache[tuple[bytes, frozenset[str]], tuple[tuple[str, int], ...]] = _LRUCache(128)
+
+# serialized threat intelligence results, keyed by (address, check type)
+_threat_report_cache: _LRUCache[tuple[str, str], str] = _LRUCache(4096)
+
+# serialized DeFi protocol results, keyed by (absolute config path, modification time in ns, size, protocol type),
+# such that a modified configuration is analyzed anew
+_defi_report_cache: _LRUCache[tuple[str, int, int, str], str] = _LRUCache(256)
+
+# Literal triggers of the line-based Solidity checks, found in a single scan over the contract.
+# None of the alternatives can overlap with another, so finditer reports every occurrence of each trigger.
+_RE_TRIGGERS = re.compile(
+    r"(?P<call_or_send>\.(?:call|send)\()|(?P<transfer>\.transfer\()|(?P<tx_origin>tx\.origin)|(?P<delegatecall>delegatecall)"
+    r"|(?P<block_value>block\.(?:timestamp|number))|(?P<function>function)"
+)
+
+
+def _find_trigger_lines(content: str) -> dict[str, dict[int, int]]:
+    """
+    Scans the given contract source for the triggers of the line-based checks.
+
+    :param content: the contract source
+    :return: a mapping from trigger name (group name in `_RE_TRIGGERS`) to a mapping from 1-based line number
+        to the offset of the trigger's first occurrence in that line, in ascending line order
+    """
+    trigger_lines: dict[str, dict[int, int]] = {name: {} for name in _RE_TRIGGERS.groupindex}
+    line_no = 1
+    pos = 0
+    for match in _RE_TRIGGERS.finditer(content):
+        start = match.start()
+        line_no += content.count("\n", pos, start)
+        pos = start
+        trigger_lines[match.lastgroup].setdefault(line_no, start)  # type: ignore[index]
+    return trigger_lines
+
+
+def _get_line_window(content: str, offset: int, lines_before: int, lines_after: int) -> str:
+    """
+    Returns the text of the line containing the given offset together with the given numbers of surrounding lines,
+    as a single slice of the content (i.e. without splitting and re-joining lines).
+    """
+    start = content.rfind("\n", 0, offset) + 1
+    for _ in range(lines_before):
+        if start == 0:
+            break
+        start = content.rfind("\n", 0, start - 1) + 1
+    end = content.find("\n", offset)
+    for _ in range(lines_after):
+        if end == -1:
+            break
+        end = content.find("\n", end + 1)
+    return content[start:] if end == -1 else content[start:end]
+
+
+def _get_enabled_checks(vulnerability_types: Iterable[str], severity_threshold: str) -> frozenset[str]:
+    """
+    Returns the known checks among the given vulnerability types whose findings meet the severity threshold.
+    Each check reports findings of a single severity, so checks below the threshold need not run at all.
+    """
+    threshold_level = _SEVERITY_LEVELS.get(severity_threshold, 2)
+    return frozenset(
+        t for t in vulnerability_types if t in _FINDING_TEMPLATES and _SEVERITY_LEVELS[_FINDING_TEMPLATES[t][0]] >= threshold_level
+    )
+
+
+def _get_analysis_cache_key(content: str, enabled_checks: frozenset[str]) -> tuple[bytes, frozenset[str]]:
+    return hashlib.blake2b(content.encode("utf-8", errors="surrogatepass"), digest_size=16).digest(), enabled_checks
+
+
 class AnalyzeSmartContractTool(Tool):
     """
     Analyzes smart contract code for common vulnerabilities and security issues.
@@ -76,31 +266,79 @@ class AnalyzeSmartContractTool(Tool):
         # Read the contract file
         content = self.project.read_file(relative_path)
 
+        # Set default vulnerability types if not specified
+        if vulnerability_types is None:
+            vulnerability_types = list(_DEFAULT_VULNERABILITY_TYPES)
+
+        return self._to_json(
+            self._create_analysis_result(relative_path, content, vulnerability_types, severity_threshold, use_language_server)
+        )
+
+    def apply_batch(
+        self,
+        relative_paths: list[str],
+        vulnerability_types: list[str] | None = None,
+        severity_threshold: str = "medium",
+        use_language_server: bool = True,
+    ) -> str:
+        """
+        Analyze several smart contract files like `apply` does for a single file. The pattern-based analyses of
+        Solidity contracts that are not cached yet are distributed over worker processes.
+
+        :param relative_paths: the relative paths to the smart contract files
+        :param vulnerability_types: see `apply`
+        :param severity_threshold: see `apply`
+        :param use_language_server: see `apply`
+        :return: JSON string with the list of analysis results, one per file, in the given order
+        """
+        contents = []
+        for relative_path in relative_paths:
+            self.project.validate_relative_path(relative_path, require_not_ignored=True)
+            contents.append(self.project.read_file(relative_path))
+
+        if vulnerability_types is None:
+            vulnerability_types = list(_DEFAULT_VULNERABILITY_TYPES)
+
+        enabled_checks = _get_enabled_checks(vulnerability_types, severity_threshold)
+        pending_contents: dict[tuple[bytes, frozenset[str]], str] = {}
+        if enabled_checks:
+            for relative_path, content in zip(relative_paths, contents, strict=True):
+                if Path(relative_path).suffix.lower() == ".sol":
+                    cache_key = _get_analysis_cache_key(content, enabled_checks)
+                    if cache_key not in pending_contents and _analysis_cache.get(cache_key) is None:
+                        pending_contents[cache_key] = content
+
+        # Spawning workers only pays off if there is more than one contract to analyze.
+        # Workers are spawned rather than forked, since forking the multi-threaded agent process is unsafe.
+        if len(pending_contents) > 1:
+            max_workers = min(len(pending_contents), os.cpu_count() or 1)
+            chunksize = max(1, len(pending_contents) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                all_findings = executor.map(
+                    self._check_solidity_content, pending_contents.values(), itertools.repeat(enabled_checks), chunksize=chunksize
+                )
+                for cache_key, findings in zip(pending_contents, all_findings, strict=True):
+                    _analysis_cache.put(cache_key, tuple(findings))
+
+        results = [
+            self._create_analysis_result(relative_path, content, vulnerability_types, severity_threshold, use_language_server)
+            for relative_path, content in zip(relative_paths, contents, strict=True)
+        ]
+        return self._to_json(results)
+
+    def _create_analysis_result(
+        self, relative_path: str, content: str, vulnerability_types: list[str], severity_threshold: str, use_language_server: bool
+    ) -> dict[str, Any]:
         # Determine file type
         file_ext = Path(relative_path).suffix.lower()
         if file_ext not in [".sol", ".vy", ".rs"]:
-            return json.dumps(
-                {
-                    "error": f"Unsupported file type: {file_ext}. Only .sol (Solidity), .vy (Vyper), and .rs (Rust/Soroban) are supported.",
-                    "file": relative_path,
-                }
-            )
-
-        # Set default vulnerability types if not specified
-        if vulnerability_types is None:
-            vulnerability_types = [
-                "reentrancy",
-                "overflow",
-                "unprotected_functions",
-                "tx_origin",
-                "delegatecall",
-                "timestamp_dependence",
-                "unchecked_calls",
-                "access_control",
-            ]
+            return {
+                "error": f"Unsupported file type: {file_ext}. Only .sol (Solidity), .vy (Vyper), and .rs (Rust/Soroban) are supported.",
+                "file": relative_path,
+            }
 
         # Perform static analysis
-        vulnerabilities = self._analyze_contract_content(content, file_ext, vulnerability_types, severity_threshold)
+        vulnerabilities = self._analyze_contract_content(content, file_ext, frozenset(vulnerability_types), severity_threshold)
 
         # Try to enhance analysis with language server if available and requested
         ls_enhanced = False
@@ -119,7 +357,7 @@ class AnalyzeSmartContractTool(Tool):
 
                 logging.getLogger(__name__).debug(f"Language server analysis failed, using pattern-based analysis only: {e}")
 
-        result = {
+        return {
             "file": relative_path,
             "file_type": file_ext,
             "vulnerabilities_found": len(vulnerabilities),
@@ -129,239 +367,203 @@ class AnalyzeSmartContractTool(Tool):
             "language_server_enhanced": ls_enhanced,
         }
 
-        return json.dumps(result, indent=2)
-
     def _analyze_contract_content(
-        self, content: str, file_ext: str, vulnerability_types: list[str], severity_threshold: str
+        self, content: str, file_ext: str, vulnerability_types: frozenset[str], severity_threshold: str
     ) -> list[VulnerabilityFinding]:
         """Perform static analysis on contract content."""
+        enabled_checks = _get_enabled_checks(vulnerability_types, severity_threshold)
+        if file_ext != ".sol" or not enabled_checks:
+            return []
+
+        # The results only depend on the content and the checks that run, so repeated analyses of an unchanged
+        # contract (e.g. with a different, but equivalent severity threshold) are served from the cache
+        cache_key = _get_analysis_cache_key(content, enabled_checks)
+        findings = _analysis_cache.get(cache_key)
+        if findings is None:
+            findings = tuple(self._check_solidity_content(content, enabled_checks))
+            _analysis_cache.put(cache_key, findings)
+
         vulnerabilities: list[VulnerabilityFinding] = []
-        severity_levels = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-        threshold_level = severity_levels.get(severity_threshold, 2)
+        for check, line in findings:
+            severity, description, recommendation = _FINDING_TEMPLATES[check]
+            vulnerabilities.append(
+                {"type": check, "severity": severity, "line": line, "description": description, "recommendation": recommendation}
+            )
+        return vulnerabilities
+
+    @classmethod
+    def _check_solidity_content(cls, content: str, vulnerability_types: frozenset[str]) -> list[tuple[str, int]]:
+        """
+        Run the given Solidity checks on the contract content, returning the (check, line) pairs of the findings.
+        Independent of any tool instance, such that it can also run in worker processes.
+        """
+        findings: list[tuple[str, int]] = []
 
-        if file_ext == ".sol":
-            # Solidity-specific checks
-            if "reentrancy" in vulnerability_types:
-                vulnerabilities.extend(self._check_reentrancy(content))
+        # Solidity-specific checks; the line-based checks only inspect the lines on which their triggers
+        # were found by a single scan over the contract
+        lines = content.split("\n")
+        triggers = _find_trigger_lines(content)
 
-            if "overflow" in vulnerability_types:
-                vulnerabilities.extend(self._check_overflow_issues(content))
+        if "reentrancy" in vulnerability_types:
+            external_calls = dict(sorted({**triggers["transfer"], **triggers["call_or_send"]}.items()))
+            findings.extend(("reentrancy", line) for line in cls._check_reentrancy(content, external_calls))
 
-            if "unprotected_functions" in vulnerability_types:
-                vulnerabilities.extend(self._check_unprotected_functions(content))
+        if "overflow" in vulnerability_types:
+            findings.extend(("overflow", line) for line in cls._check_overflow_issues(content, lines))
 
-            if "tx_origin" in vulnerability_types:
-                vulnerabilities.extend(self._check_tx_origin(content))
+        if "unprotected_functions" in vulnerability_types:
+            findings.extend(
+                ("unprotected_functions", line) for line in cls._check_unprotected_functions(content, lines, triggers["function"])
+            )
 
-            if "delegatecall" in vulnerability_types:
-                vulnerabilities.extend(self._check_delegatecall(content))
+        if "tx_origin" in vulnerability_types:
+            findings.extend(("tx_origin", line) for line in cls._check_tx_origin(triggers["tx_origin"]))
 
-            if "timestamp_dependence" in vulnerability_types:
-                vulnerabilities.extend(self._check_timestamp_dependence(content))
+        if "delegatecall" in vulnerability_types:
+            findings.extend(("delegatecall", line) for line in cls._check_delegatecall(lines, triggers["delegatecall"]))
 
-            if "unchecked_calls" in vulnerability_types:
-                vulnerabilities.extend(self._check_unchecked_calls(content))
+        if "timestamp_dependence" in vulnerability_types:
+            findings.extend(("timestamp_dependence", line) for line in cls._check_timestamp_dependence(content, triggers["block_value"]))
 
-            if "access_control" in vulnerability_types:
-                vulnerabilities.extend(self._check_access_control(content))
+        if "unchecked_calls" in vulnerability_types:
+            findings.extend(("unchecked_calls", line) for line in cls._check_unchecked_calls(content, triggers["call_or_send"]))
 
-        # Filter by severity threshold
-        filtered_vulnerabilities = [v for v in vulnerabilities if severity_levels.get(v["severity"], 0) >= threshold_level]
+        if "access_control" in vulnerability_types:
+            findings.extend(("access_control", line) for line in cls._check_access_control(content, lines, triggers["function"]))
 
-        return filtered_vulnerabilities
+        return findings
 
-    def _check_reentrancy(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_reentrancy(content: str, external_calls: Mapping[int, int]) -> list[int]:
         """Check for reentrancy vulnerabilities."""
-        vulnerabilities: list[VulnerabilityFinding] = []
+        finding_lines: list[int] = []
 
         # Pattern: external calls followed by state changes
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            if re.search(r"\.(call|transfer|send)\(", line):
-                # Check if state changes occur after external call
-                remaining_lines = "\n".join(lines[i:])
-                if re.search(r"\w+\s*=\s*", remaining_lines[:500]):  # Check next ~500 chars
-                    vulnerabilities.append(
-                        {
-                            "type": "reentrancy",
-                            "severity": "high",
-                            "line": i,
-                            "description": "Potential reentrancy vulnerability: state change after external call",
-                            "recommendation": "Use checks-effects-interactions pattern or ReentrancyGuard",
-                        }
-                    )
+        for i, offset in external_calls.items():
+            # Check if state changes occur after external call, i.e. in the next ~500 chars after the call's line
+            line_end = content.find("\n", offset)
+            following_text = content[line_end + 1 : line_end + 501] if line_end != -1 else ""
+            if _RE_ASSIGNMENT.search(following_text):
+                finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_overflow_issues(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_overflow_issues(content: str, lines: list[str]) -> list[int]:
         """Check for integer overflow/underflow issues."""
-        vulnerabilities: list[VulnerabilityFinding] = []
+        finding_lines: list[int] = []
 
         # Check for Solidity version without overflow protection
-        version_match = re.search(r"pragma solidity\s+([^;]+);", content)
+        if "pragma solidity" not in content:
+            return finding_lines
+        version_match = _RE_PRAGMA_SOLIDITY.search(content)
         if version_match:
             version_str = version_match.group(1).strip()
             # Versions before 0.8.0 don't have built-in overflow protection
-            # Match exactly 0.8.0, not 0.8.1+
-            if re.match(r"[\^~]?0\.[0-7]\.", version_str) or re.match(r"[\^~]?0\.8\.0(?:[^\d]|$)", version_str):
+            # (0.8.0 itself is included, 0.8.1+ is not)
+            m = _RE_VERSION.match(version_str)
+            if m and (int(m.group(1)), int(m.group(2)), int(m.group(3))) <= (0, 8, 0):
                 # Look for arithmetic operations
-                lines = content.split("\n")
                 for i, line in enumerate(lines, 1):
-                    if re.search(r"[\+\-\*](?!=)", line) and not re.search(r"SafeMath", line):
-                        vulnerabilities.append(
-                            {
-                                "type": "overflow",
-                                "severity": "medium",
-                                "line": i,
-                                "description": "Potential integer overflow/underflow without SafeMath",
-                                "recommendation": "Use SafeMath library or upgrade to Solidity 0.8.0+",
-                            }
-                        )
+                    if ("+" in line or "-" in line or "*" in line) and "SafeMath" not in line and _RE_ARITHMETIC.search(line):
+                        finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_unprotected_functions(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_unprotected_functions(content: str, lines: list[str], function_lines: Mapping[int, int]) -> list[int]:
         """Check for functions without access control."""
-        vulnerabilities: list[VulnerabilityFinding] = []
-        lines = content.split("\n")
+        finding_lines: list[int] = []
 
-        for i, line in enumerate(lines, 1):
+        for i, offset in function_lines.items():
+            line = lines[i - 1]
             # Look for public/external functions without modifiers
-            if re.search(r"function\s+\w+\s*\([^)]*\)\s+(public|external)", line):
-                # Check if function has modifiers - search in surrounding lines (as string)
-                # Get surrounding context (2 lines before to 2 lines after)
-                start_idx = max(0, i - 2)
-                end_idx = min(len(lines), i + 3)
-                surrounding_context = "\n".join(lines[start_idx:end_idx])
-                has_modifier = bool(
-                    re.search(r"(onlyOwner|onlyRole|requiresAuth|nonReentrant|whenNotPaused|modifier)", surrounding_context)
-                )
+            if _RE_PUBLIC_FUNCTION_SIGNATURE.search(line):
+                # Check if function has modifiers - search in surrounding lines (1 line before to 3 lines after)
+                surrounding_context = _get_line_window(content, offset, lines_before=1, lines_after=3)
+                has_modifier = bool(_RE_PROTECTING_MODIFIER.search(surrounding_context))
 
                 # Skip view/pure functions
-                is_view_or_pure = bool(re.search(r"\b(view|pure)\b", line))
+                is_view_or_pure = bool(_RE_VIEW_OR_PURE.search(line))
 
                 if not has_modifier and not is_view_or_pure:
-                    vulnerabilities.append(
-                        {
-                            "type": "unprotected_functions",
-                            "severity": "high",
-                            "line": i,
-                            "description": "Public/external function without access control modifier",
-                            "recommendation": "Add appropriate access control modifiers (e.g., onlyOwner)",
-                        }
-                    )
+                    finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_tx_origin(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_tx_origin(tx_origin_lines: Iterable[int]) -> list[int]:
         """Check for tx.origin usage."""
-        vulnerabilities: list[VulnerabilityFinding] = []
-        lines = content.split("\n")
+        finding_lines: list[int] = []
 
-        for i, line in enumerate(lines, 1):
-            if "tx.origin" in line:
-                vulnerabilities.append(
-                    {
-                        "type": "tx_origin",
-                        "severity": "high",
-                        "description": "Use of tx.origin for authorization",
-                        "line": i,
-                        "recommendation": "Use msg.sender instead of tx.origin",
-                    }
-                )
+        for i in tx_origin_lines:
+            finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_delegatecall(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_delegatecall(lines: list[str], delegatecall_lines: Iterable[int]) -> list[int]:
         """Check for unsafe delegatecall usage."""
-        vulnerabilities: list[VulnerabilityFinding] = []
-        lines = content.split("\n")
+        finding_lines: list[int] = []
 
-        for i, line in enumerate(lines, 1):
-            if "delegatecall" in line and not re.search(r"//.*delegatecall", line):
-                vulnerabilities.append(
-                    {
-                        "type": "delegatecall",
-                        "severity": "critical",
-                        "line": i,
-                        "description": "Delegatecall to untrusted contract can lead to complete contract takeover",
-                        "recommendation": "Ensure delegatecall target is trusted and immutable",
-                    }
-                )
+        for i in delegatecall_lines:
+            line = lines[i - 1]
+            if "//" not in line or not _RE_COMMENTED_DELEGATECALL.search(line):
+                finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_timestamp_dependence(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_timestamp_dependence(content: str, block_value_lines: Mapping[int, int]) -> list[int]:
         """Check for timestamp dependence vulnerabilities."""
-        vulnerabilities: list[VulnerabilityFinding] = []
-        lines = content.split("\n")
+        finding_lines: list[int] = []
 
-        for i, line in enumerate(lines, 1):
-            if re.search(r"block\.(timestamp|number)", line):
-                # Check if used in critical logic - search in surrounding lines (as string)
-                start_idx = max(0, i - 3)
-                end_idx = min(len(lines), i + 1)
-                surrounding_context = "\n".join(lines[start_idx:end_idx])
-                if re.search(r"(require|if|assert)", surrounding_context):
-                    vulnerabilities.append(
-                        {
-                            "type": "timestamp_dependence",
-                            "severity": "medium",
-                            "line": i,
-                            "description": "Reliance on block.timestamp or block.number",
-                            "recommendation": "Avoid using block.timestamp for critical logic; miners can manipulate it",
-                        }
-                    )
+        for i, offset in block_value_lines.items():
+            # Check if used in critical logic - search in surrounding lines (2 lines before to 1 line after)
+            surrounding_context = _get_line_window(content, offset, lines_before=2, lines_after=1)
+            if "require" in surrounding_context or "if" in surrounding_context or "assert" in surrounding_context:
+                finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_unchecked_calls(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_unchecked_calls(content: str, call_or_send_lines: Mapping[int, int]) -> list[int]:
         """Check for unchecked external calls."""
-        vulnerabilities: list[VulnerabilityFinding] = []
-        lines = content.split("\n")
+        finding_lines: list[int] = []
 
-        for i, line in enumerate(lines, 1):
-            if re.search(r"\.(call|send)\(", line):
-                # Check if return value is checked
-                surrounding_context = "\n".join(lines[max(0, i - 2) : i + 2])
-                if not re.search(r"(require|assert|if)\s*\(.*\.(call|send)", surrounding_context):
-                    vulnerabilities.append(
-                        {
-                            "type": "unchecked_calls",
-                            "severity": "high",
-                            "line": i,
-                            "description": "Unchecked return value from external call",
-                            "recommendation": "Always check return values from .call() and .send()",
-                        }
-                    )
+        for i, offset in call_or_send_lines.items():
+            # Check if return value is checked - search in surrounding lines (1 line before to 2 lines after)
+            surrounding_context = _get_line_window(content, offset, lines_before=1, lines_after=2)
+            if not _RE_CHECKED_CALL.search(surrounding_context):
+                finding_lines.append(i)
 
-        return vulnerabilities
+        return finding_lines
 
-    def _check_access_control(self, content: str) -> list[VulnerabilityFinding]:
+    @staticmethod
+    def _check_access_control(content: str, lines: list[str], function_lines: Collection[int]) -> list[int]:
         """Check for missing or weak access control."""
-        vulnerabilities: list[VulnerabilityFinding] = []
+        finding_lines: list[int] = []
+
+        # Without any function declarations, there is nothing to report
+        if not function_lines:
+            return finding_lines
 
-        # Check if contract uses any access control mechanism
-        has_access_control = bool(re.search(r"(Ownable|AccessControl|onlyOwner|onlyRole)", content, re.IGNORECASE))
+        # Check if contract uses any access control mechanism (case-insensitively)
+        content_lower = content.lower()
+        has_access_control = (
+            "ownable" in content_lower or "accesscontrol" in content_lower or "onlyowner" in content_lower or "onlyrole" in content_lower
+        )
 
         if not has_access_control:
-            lines = content.split("\n")
-            for i, line in enumerate(lines, 1):
+            for i in function_lines:
+                line = lines[i - 1]
                 # Look for state-changing functions
-                if re.search(r"function\s+\w+.*\b(public|external)\b", line):
-                    if not re.search(r"\b(view|pure)\b", line):
-                        vulnerabilities.append(
-                            {
-                                "type": "access_control",
-                                "severity": "medium",
-                                "line": i,
-                                "description": "Contract lacks access control mechanism",
-                                "recommendation": "Implement Ownable or AccessControl pattern",
-                            }
-                        )
+                if _RE_PUBLIC_FUNCTION.search(line):
+                    if not _RE_VIEW_OR_PURE.search(line):
+                        finding_lines.append(i)
                         break  # Only report once per contract
 
-        return vulnerabilities
+        return finding_lines
 
     def _analyze_with_language_server(self, relative_path: str, vulnerability_types: list[str]) -> list[VulnerabilityFinding]:
         """
@@ -408,42 +610,55 @@ class AnalyzeTransactionTool(Tool):
             Supported: "mev", "flash_loan", "unusual_gas", "suspicious_calls", "token_approval"
         :return: JSON string with transaction analysis results
         """
-        if not transaction_hash and not transaction_data:
-            return json.dumps({"error": "Either transaction_hash or transaction_data must be provided"})
-
         # Set default check types
         if check_types is None:
-            check_types = ["mev", "flash_loan", "unusual_gas", "suspicious_calls", "token_approval"]
+            check_types = list(_DEFAULT_TRANSACTION_CHECK_TYPES)
+
+        return self._to_json(self._create_analysis_result(transaction_hash, transaction_data, check_types, frozenset(check_types)))
+
+    def apply_batch(self, transactions: list[dict[str, Any]], check_types: list[str] | None = None) -> str:
+        """
+        Analyze several raw transactions like `apply` does for a single transaction's data, determining the
+        checks to perform only once for all of them.
+
+        :param transactions: the raw transaction data dicts
+        :param check_types: see `apply`
+        :return: JSON string with the list of analysis results, one per transaction, in the given order
+        """
+        if check_types is None:
+            check_types = list(_DEFAULT_TRANSACTION_CHECK_TYPES)
+        check_set = frozenset(check_types)
+
+        results = [self._create_analysis_result(None, transaction_data, check_types, check_set) for transaction_data in transactions]
+        return self._to_json(results)
+
+    def _create_analysis_result(
+        self,
+        transaction_hash: str | None,
+        transaction_data: dict[str, Any] | None,
+        check_types: list[str],
+        check_set: frozenset[str],
+    ) -> dict[str, Any]:
+        """
+        :return: the analysis result for the given transaction (see `apply`) or an error dict if neither
+            the hash nor the data of the transaction is given
+        """
+        if not transaction_hash and not transaction_data:
+            return {"error": "Either transaction_hash or transaction_data must be provided"}
 
         findings = []
         risk_score = 0
 
         if transaction_data:
-            # Analyze transaction data
-            if "mev" in check_types:
-                mev_findings = self._check_mev_patterns(transaction_data)
-                findings.extend(mev_findings)
-                risk_score += len(mev_findings) * 3
-
-            if "flash_loan" in check_types:
-                flash_loan_findings = self._check_flash_loan_patterns(transaction_data)
-                findings.extend(flash_loan_findings)
-                risk_score += len(flash_loan_findings) * 4
-
-            if "unusual_gas" in check_types:
-                gas_findings = self._check_unusual_gas(transaction_data)
-                findings.extend(gas_findings)
-                risk_score += len(gas_findings) * 2
-
-            if "suspicious_calls" in check_types:
-                call_findings = self._check_suspicious_calls(transaction_data)
-                findings.extend(call_findings)
-                risk_score += len(call_findings) * 3
-
-            if "token_approval" in check_types:
-                approval_findings = self._check_token_approvals(transaction_data)
-                findings.extend(approval_findings)
-                risk_score += len(approval_findings) * 2
+            # Stringify and lowercase each call once; the call-based checks below all search these strings
+            call_strs = [str(call).lower() for call in transaction_data["calls"]] if "calls" in transaction_data else []
+
+            # Analyze transaction data; each finding adds the risk weight of the check that reported it
+            for check_type, (check, risk_weight) in self._TRANSACTION_CHECKS.items():
+                if check_type in check_set:
+                    check_findings = check(self, transaction_data, call_strs)
+                    findings.extend(check_findings)
+                    risk_score += len(check_findings) * risk_weight
 
         result = {
             "transaction_hash": transaction_hash,
@@ -454,24 +669,28 @@ class AnalyzeTransactionTool(Tool):
             "checked_types": check_types,
         }
 
-        return json.dumps(result, indent=2)
+        return result
+
+    def _check_mev_patterns(self, tx_data: dict[str, Any], call_strs: list[str]) -> list[dict[str, Any]]:
+        """
+        Check for MEV (Maximal Extractable Value) patterns.
 
-    def _check_mev_patterns(self, tx_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Check for MEV (Maximal Extractable Value) patterns."""
+        :param tx_data: the transaction data
+        :param call_strs: the lowercased string representations of the transaction's calls
+        """
         findings = []
 
         # Check for sandwich attack patterns
-        if "calls" in tx_data:
-            dex_interactions = [call for call in tx_data["calls"] if "swap" in str(call).lower()]
-            if len(dex_interactions) > 2:
-                findings.append(
-                    {
-                        "type": "mev",
-                        "severity": "medium",
-                        "description": "Multiple DEX swaps detected - possible sandwich attack",
-                        "details": f"Found {len(dex_interactions)} DEX interactions",
-                    }
-                )
+        num_dex_interactions = sum(1 for call_str in call_strs if "swap" in call_str)
+        if num_dex_interactions > 2:
+            findings.append(
+                {
+                    "type": "mev",
+                    "severity": "medium",
+                    "description": "Multiple DEX swaps detected - possible sandwich attack",
+                    "details": f"Found {num_dex_interactions} DEX interactions",
+                }
+            )
 
         # Check for front-running indicators
         if tx_data.get("gas_price", 0) > 100:  # Arbitrary high gas price
@@ -486,29 +705,34 @@ class AnalyzeTransactionTool(Tool):
 
         return findings
 
-    def _check_flash_loan_patterns(self, tx_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Check for flash loan attack patterns."""
+    def _check_flash_loan_patterns(self, tx_data: dict[str, Any], call_strs: list[str]) -> list[dict[str, Any]]:
+        """
+        Check for flash loan attack patterns.
+
+        :param tx_data: the transaction data
+        :param call_strs: the lowercased string representations of the transaction's calls
+        """
         findings = []
 
-        if "calls" in tx_data:
-            flash_loan_keywords = ["flashloan", "borrow", "repay"]
-            for call in tx_data["calls"]:
-                call_str = str(call).lower()
-                if any(keyword in call_str for keyword in flash_loan_keywords):
-                    findings.append(
-                        {
-                            "type": "flash_loan",
-                            "severity": "high",
-                            "description": "Flash loan detected in transaction",
-                            "details": "Transaction involves flash loan operations",
-                        }
-                    )
-                    break
+        if any(_RE_FLASH_LOAN_KEYWORD.search(call_str) for call_str in call_strs):
+            findings.append(
+                {
+                    "type": "flash_loan",
+                    "severity": "high",
+                    "description": "Flash loan detected in transaction",
+                    "details": "Transaction involves flash loan operations",
+                }
+            )
 
         return findings
 
-    def _check_unusual_gas(self, tx_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Check for unusual gas usage patterns."""
+    def _check_unusual_gas(self, tx_data: dict[str, Any], call_strs: list[str]) -> list[dict[str, Any]]:
+        """
+        Check for unusual gas usage patterns.
+
+        :param tx_data: the transaction data
+        :param call_strs: the lowercased string representations of the transaction's calls
+        """
         findings = []
 
         gas_limit = tx_data.get("gas_limit", 0)
@@ -525,45 +749,51 @@ class AnalyzeTransactionTool(Tool):
 
         return findings
 
-    def _check_suspicious_calls(self, tx_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Check for suspicious contract calls."""
+    def _check_suspicious_calls(self, tx_data: dict[str, Any], call_strs: list[str]) -> list[dict[str, Any]]:
+        """
+        Check for suspicious contract calls.
+
+        :param tx_data: the transaction data
+        :param call_strs: the lowercased string representations of the transaction's calls
+        """
         findings = []
 
-        if "calls" in tx_data:
-            suspicious_methods = ["selfdestruct", "delegatecall", "suicide"]
-            for call in tx_data["calls"]:
-                call_str = str(call).lower()
-                for method in suspicious_methods:
-                    if method in call_str:
-                        findings.append(
-                            {
-                                "type": "suspicious_calls",
-                                "severity": "critical",
-                                "description": f"Suspicious method call detected: {method}",
-                                "details": f"Method {method} can be dangerous",
-                            }
-                        )
+        suspicious_methods = ["selfdestruct", "delegatecall", "suicide"]
+        for call_str in call_strs:
+            for method in suspicious_methods:
+                if method in call_str:
+                    findings.append(
+                        {
+                            "type": "suspicious_calls",
+                            "severity": "critical",
+                            "description": f"Suspicious method call detected: {method}",
+                            "details": f"Method {method} can be dangerous",
+                        }
+                    )
 
         return findings
 
-    def _check_token_approvals(self, tx_data: dict[str, Any]) -> list[dict[str, Any]]:
-        """Check for risky token approvals."""
+    def _check_token_approvals(self, tx_data: dict[str, Any], call_strs: list[str]) -> list[dict[str, Any]]:
+        """
+        Check for risky token approvals.
+
+        :param tx_data: the transaction data
+        :param call_strs: the lowercased string representations of the transaction's calls
+        """
         findings = []
 
-        if "calls" in tx_data:
-            for call in tx_data["calls"]:
-                call_str = str(call).lower()
-                if "approve" in call_str:
-                    # Check for unlimited approvals
-                    if "ffffffff" in call_str or "max" in call_str:
-                        findings.append(
-                            {
-                                "type": "token_approval",
-                                "severity": "medium",
-                                "description": "Unlimited token approval detected",
-                                "details": "Consider approving only required amount",
-                            }
-                        )
+        for call_str in call_strs:
+            if "approve" in call_str:
+                # Check for unlimited approvals
+                if "ffffffff" in call_str or "max" in call_str:
+                    findings.append(
+                        {
+                            "type": "token_approval",
+                            "severity": "medium",
+                            "description": "Unlimited token approval detected",
+                            "details": "Consider approving only required amount",
+                        }
+                    )
 
         return findings
 
@@ -578,6 +808,15 @@ class AnalyzeTransactionTool(Tool):
         else:
             return "low"
 
+    # the transaction checks by check type, in the order in which their findings are reported, with each check's risk weight
+    _TRANSACTION_CHECKS: dict[str, tuple[Callable[["AnalyzeTransactionTool", dict[str, Any], list[str]], list[dict[str, Any]]], int]] = {
+        "mev": (_check_mev_patterns, 3),
+        "flash_loan": (_check_flash_loan_patterns, 4),
+        "unusual_gas": (_check_unusual_gas, 2),
+        "suspicious_calls": (_check_suspicious_calls, 3),
+        "token_approval": (_check_token_approvals, 2),
+    }
+
 
 class CheckDeFiProtocolTool(Tool):
     """
@@ -594,23 +833,34 @@ class CheckDeFiProtocolTool(Tool):
         """
         self.project.validate_relative_path(protocol_config_path, require_not_ignored=True)
 
+        # The results only depend on the configuration and the protocol type, so unmodified configurations
+        # are served from the cache without being read again
+        abs_path = os.path.join(self.get_project_root(), protocol_config_path)
+        stat = os.stat(abs_path)
+        cache_key = (abs_path, stat.st_mtime_ns, stat.st_size, protocol_type)
+        cached_result = _defi_report_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         # Read configuration
         content = self.project.read_file(protocol_config_path)
+        # The keyword checks are case-insensitive; lowercase the content only once for all of them
+        content_lower = content.lower()
 
         findings = []
 
         # Protocol-specific checks
         if protocol_type == "lending":
-            findings.extend(self._check_lending_protocol(content))
+            findings.extend(self._check_lending_protocol(content_lower))
         elif protocol_type == "dex":
-            findings.extend(self._check_dex_protocol(content))
+            findings.extend(self._check_dex_protocol(content_lower))
         elif protocol_type == "staking":
-            findings.extend(self._check_staking_protocol(content))
+            findings.extend(self._check_staking_protocol(content_lower))
         elif protocol_type == "yield_farming":
-            findings.extend(self._check_yield_farming_protocol(content))
+            findings.extend(self._check_yield_farming_protocol(content_lower))
 
         # Common checks for all protocols
-        findings.extend(self._check_common_defi_issues(content))
+        findings.extend(self._check_common_defi_issues(content_lower))
 
         result = {
             "protocol_config": protocol_config_path,
@@ -619,14 +869,16 @@ class CheckDeFiProtocolTool(Tool):
             "findings": findings,
         }
 
-        return json.dumps(result, indent=2)
+        result_json = self._to_json(result)
+        _defi_report_cache.put(cache_key, result_json)
+        return result_json
 
-    def _check_lending_protocol(self, content: str) -> list[dict[str, Any]]:
+    def _check_lending_protocol(self, content_lower: str) -> list[dict[str, Any]]:
         """Check lending protocol specific issues."""
         findings = []
 
         # Check for oracle manipulation risks
-        if "oracle" in content.lower():
+        if "oracle" in content_lower:
             findings.append(
                 {
                     "type": "oracle_risk",
@@ -637,7 +889,7 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for liquidation parameters
-        if "liquidation" not in content.lower():
+        if "liquidation" not in content_lower:
             findings.append(
                 {
                     "type": "missing_liquidation",
@@ -648,7 +900,7 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for collateral factor
-        collateral_match = re.search(r"collateral.*factor[\"']?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)", content, re.IGNORECASE)
+        collateral_match = _RE_COLLATERAL_FACTOR.search(content_lower)
         if collateral_match:
             try:
                 collateral_factor = float(collateral_match.group(1))
@@ -667,12 +919,12 @@ class CheckDeFiProtocolTool(Tool):
 
         return findings
 
-    def _check_dex_protocol(self, content: str) -> list[dict[str, Any]]:
+    def _check_dex_protocol(self, content_lower: str) -> list[dict[str, Any]]:
         """Check DEX protocol specific issues."""
         findings = []
 
         # Check for slippage protection
-        if "slippage" not in content.lower():
+        if "slippage" not in content_lower:
             findings.append(
                 {
                     "type": "missing_slippage",
@@ -683,7 +935,7 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for MEV protection
-        if "mev" not in content.lower() and "flashbot" not in content.lower():
+        if "mev" not in content_lower and "flashbot" not in content_lower:
             findings.append(
                 {
                     "type": "mev_risk",
@@ -695,12 +947,12 @@ class CheckDeFiProtocolTool(Tool):
 
         return findings
 
-    def _check_staking_protocol(self, content: str) -> list[dict[str, Any]]:
+    def _check_staking_protocol(self, content_lower: str) -> list[dict[str, Any]]:
         """Check staking protocol specific issues."""
         findings = []
 
         # Check for lock period
-        if "lock" not in content.lower() and "lockup" not in content.lower():
+        if "lock" not in content_lower and "lockup" not in content_lower:
             findings.append(
                 {
                     "type": "missing_lock_period",
@@ -711,9 +963,9 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for reward rate
-        if "reward" in content.lower():
+        if "reward" in content_lower:
             # Check for unrealistic reward rates
-            reward_match = re.search(r"reward.*rate[\"']?\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)", content, re.IGNORECASE)
+            reward_match = _RE_REWARD_RATE.search(content_lower)
             if reward_match:
                 try:
                     reward_rate = float(reward_match.group(1))
@@ -732,12 +984,12 @@ class CheckDeFiProtocolTool(Tool):
 
         return findings
 
-    def _check_yield_farming_protocol(self, content: str) -> list[dict[str, Any]]:
+    def _check_yield_farming_protocol(self, content_lower: str) -> list[dict[str, Any]]:
         """Check yield farming protocol specific issues."""
         findings = []
 
         # Check for impermanent loss warnings
-        if "impermanent" not in content.lower():
+        if "impermanent" not in content_lower:
             findings.append(
                 {
                     "type": "missing_il_warning",
@@ -749,12 +1001,12 @@ class CheckDeFiProtocolTool(Tool):
 
         return findings
 
-    def _check_common_defi_issues(self, content: str) -> list[dict[str, Any]]:
+    def _check_common_defi_issues(self, content_lower: str) -> list[dict[str, Any]]:
         """Check common DeFi security issues."""
         findings = []
 
         # Check for pause mechanism
-        if "pause" not in content.lower():
+        if "pause" not in content_lower:
             findings.append(
                 {
                     "type": "missing_pause",
@@ -765,7 +1017,7 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for access control
-        if "owner" not in content.lower() and "admin" not in content.lower():
+        if "owner" not in content_lower and "admin" not in content_lower:
             findings.append(
                 {
                     "type": "missing_access_control",
@@ -776,7 +1028,7 @@ class CheckDeFiProtocolTool(Tool):
             )
 
         # Check for upgrade mechanism
-        if "proxy" in content.lower() or "upgradeable" in content.lower():
+        if "proxy" in content_lower or "upgradeable" in content_lower:
             findings.append(
                 {
                     "type": "upgradeable_contract",
@@ -802,47 +1054,35 @@ class Web3ThreatIntelligenceTool(Tool):
         :param check_type: type of check to perform ("all", "scam", "phishing", "hack", "sanctions")
         :return: JSON string with threat intelligence results
         """
-        if not re.match(r"^0x[a-fA-F0-9]{40}$", address):
-            return json.dumps({"error": "Invalid address format. Expected 0x followed by 40 hex characters"})
+        if not _RE_ADDRESS.match(address):
+            return self._to_json({"error": "Invalid address format. Expected 0x followed by 40 hex characters"})
+
+        # The checks only depend on the address and the check type, so repeated checks are served from the cache
+        cache_key = (address, check_type)
+        cached_result = _threat_report_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
 
         findings: list[ThreatFinding] = []
         threat_level = "none"
 
         # Simulate threat intelligence checks (in production, would call real APIs)
         # Common patterns for known malicious addresses
-        suspicious_patterns = self._check_suspicious_patterns(address)
+        # The checks work on the lowercased address, which is computed only once
+        address_lower = address.lower()
+        suspicious_patterns = self._check_suspicious_patterns(address_lower)
 
         if suspicious_patterns:
             findings.extend(suspicious_patterns)
             threat_level = "high"
 
-        # Check against known scam patterns
-        if check_type in ["all", "scam"]:
-            scam_findings = self._check_scam_database(address)
-            findings.extend(scam_findings)
-            if scam_findings:
-                threat_level = "critical"
-
-        # Check against phishing databases
-        if check_type in ["all", "phishing"]:
-            phishing_findings = self._check_phishing_database(address)
-            findings.extend(phishing_findings)
-            if phishing_findings and threat_level == "none":
-                threat_level = "high"
-
-        # Check against hack databases
-        if check_type in ["all", "hack"]:
-            hack_findings = self._check_hack_database(address)
-            findings.extend(hack_findings)
-            if hack_findings and threat_level == "none":
-                threat_level = "high"
-
-        # Check sanctions lists
-        if check_type in ["all", "sanctions"]:
-            sanction_findings = self._check_sanctions_list(address)
-            findings.extend(sanction_findings)
-            if sanction_findings:
-                threat_level = "critical"
+        # Check against the selected threat databases; findings raise the threat level to the one implied by the database
+        for database_check_type, check_database, database_threat_level in self._DATABASE_CHECKS:
+            if check_type == "all" or check_type == database_check_type:
+                database_findings = check_database(self, address_lower)
+                findings.extend(database_findings)
+                if database_findings and _THREAT_LEVELS[database_threat_level] > _THREAT_LEVELS[threat_level]:
+                    threat_level = database_threat_level
 
         result = {
             "address": address,
@@ -853,45 +1093,50 @@ class Web3ThreatIntelligenceTool(Tool):
             "recommendation": self._get_recommendation(threat_level),
         }
 
-        return json.dumps(result, indent=2)
+        result_json = self._to_json(result)
+        _threat_report_cache.put(cache_key, result_json)
+        return result_json
 
-    def _check_suspicious_patterns(self, address: str) -> list[ThreatFinding]:
+    def _check_suspicious_patterns(self, address_lower: str) -> list[ThreatFinding]:
         """Check for suspicious address patterns."""
         findings: list[ThreatFinding] = []
 
         # Check for vanity addresses (might be impersonation)
-        if address.lower().startswith("0x000000") or address.lower().startswith("0xffffff"):
-            findings.append(
-                {
-                    "threat_type": "suspicious_pattern",
-                    "severity": "low",
-                    "description": "Vanity address detected - possible impersonation attempt",
-                    "details": "Address has suspicious leading zeros/F's",
-                }
-            )
+        for prefix_length in _VANITY_ADDRESS_PREFIX_LENGTHS:
+            details = _VANITY_ADDRESS_PREFIXES.get(address_lower[2 : 2 + prefix_length])
+            if details is not None:
+                findings.append(
+                    {
+                        "threat_type": "suspicious_pattern",
+                        "severity": "low",
+                        "description": "Vanity address detected - possible impersonation attempt",
+                        "details": details,
+                    }
+                )
+                break
 
         return findings
 
-    def _check_scam_database(self, address: str) -> list[ThreatFinding]:
+    def _check_scam_database(self, address_lower: str) -> list[ThreatFinding]:
         """Check against scam database."""
         findings: list[ThreatFinding] = []
         # In production, this would query real scam databases
         # For now, provide framework for integration
         return findings
 
-    def _check_phishing_database(self, address: str) -> list[ThreatFinding]:
+    def _check_phishing_database(self, address_lower: str) -> list[ThreatFinding]:
         """Check against phishing database."""
         findings: list[ThreatFinding] = []
         # In production, this would query phishing databases
         return findings
 
-    def _check_hack_database(self, address: str) -> list[ThreatFinding]:
+    def _check_hack_database(self, address_lower: str) -> list[ThreatFinding]:
         """Check against hack/exploit databases."""
         findings: list[ThreatFinding] = []
         # In production, this would query exploit databases
         return findings
 
-    def _check_sanctions_list(self, address: str) -> list[ThreatFinding]:
+    def _check_sanctions_list(self, address_lower: str) -> list[ThreatFinding]:
         """Check against sanctions lists (OFAC, etc.)."""
         findings: list[ThreatFinding] = []
         # In production, this would query sanctions lists
@@ -908,5 +1153,13 @@ class Web3ThreatIntelligenceTool(Tool):
         }
         return recommendations.get(threat_level, "Unknown threat level")
 
+    # (check type, check, threat level implied by findings) of the threat databases, in the order in which they are checked
+    _DATABASE_CHECKS: tuple[tuple[str, Callable[["Web3ThreatIntelligenceTool", str], list[ThreatFinding]], str], ...] = (
+        ("scam", _check_scam_database, "critical"),
+        ("phishing", _check_phishing_database, "high"),
+        ("hack", _check_hack_database, "high"),
+        ("sanctions", _check_sanctions_list, "critical"),
+    )
+
 
 # Import advanced vulnerability detection tools
@@ -1,7 +1,8 @@
 import os
 from dataclasses import MISSING, Field
-from typing import Any, Literal, cast, overload
+from typing import IO, Any, Literal, cast, overload
 
+import yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
 
@@ -18,6 +19,17 @@ def _create_YAML(preserve_comments: bool = False) -> YAML:
     return result
 
 
+# PyYAML's libyaml-based safe loader, falling back to the pure-Python one if PyYAML was built without libyaml
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_safe(stream: IO[str]) -> Any:
+    """
+    Loads a YAML document like `yaml.safe_load`, using the (much faster) libyaml-based loader where available.
+    """
+    return yaml.load(stream, Loader=_YAML_SAFE_LOADER)
+
+
 @overload
 def load_yaml(path: str, preserve_comments: Literal[False]) -> dict: ...
 @overload
@@ -4,12 +4,19 @@ Provides Cairo specific instantiation of the LanguageServer class using cairo-la
 
 import logging
 import os
-import shutil
-import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from overrides import override
 
+from solidlsp.language_servers.common import (
+    BASIC_CLIENT_CAPABILITIES,
+    find_executable,
+    get_cached_launch_command,
+    probe_command,
+    probe_command_output,
+    start_basic_language_server,
+)
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_logger import LanguageServerLogger
@@ -38,20 +45,14 @@ class CairoLanguageServer(SolidLanguageServer):
     def _check_cairo_available():
         """Check if Cairo/Scarb is available."""
         # Try scarb first (recommended Cairo toolchain manager)
-        try:
-            result = subprocess.run(["scarb", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return ("scarb", result.stdout.strip())
-        except FileNotFoundError:
-            pass
+        version = probe_command_output("scarb", "--version")
+        if version is not None:
+            return ("scarb", version)
 
         # Try cairo CLI
-        try:
-            result = subprocess.run(["cairo-compile", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return ("cairo", result.stdout.strip())
-        except FileNotFoundError:
-            pass
+        version = probe_command_output("cairo-compile", "--version")
+        if version is not None:
+            return ("cairo", version)
 
         return None
 
@@ -59,29 +60,19 @@ class CairoLanguageServer(SolidLanguageServer):
     def _get_cairo_ls_path():
         """Get cairo-language-server path."""
         # Try to find cairo-language-server in PATH
-        ls_path = shutil.which("cairo-language-server")
+        ls_path = find_executable("cairo-language-server")
         if ls_path:
             return ls_path
 
         # Try scarb cairo-language-server
-        scarb_path = shutil.which("scarb")
-        if scarb_path:
-            try:
-                result = subprocess.run(
-                    ["scarb", "cairo-language-server", "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    return ["scarb", "cairo-language-server"]
-            except (subprocess.SubprocessError, FileNotFoundError, OSError):
-                pass
+        scarb_path = find_executable("scarb")
+        if scarb_path and probe_command("scarb", "cairo-language-server", "--version"):
+            return ["scarb", "cairo-language-server"]
 
         # Alternative: look in ~/.cairo/bin
-        home = os.path.expanduser("~")
-        cairo_ls = os.path.join(home, ".cairo", "bin", "cairo-language-server")
-        if os.path.exists(cairo_ls):
+        # (looked up like the executables on the PATH, such that a found executable is cached)
+        cairo_ls = find_executable(os.path.join(os.path.expanduser("~"), ".cairo", "bin", "cairo-language-server"))
+        if cairo_ls:
             return cairo_ls
 
         return None
@@ -92,7 +83,13 @@ class CairoLanguageServer(SolidLanguageServer):
         Check if required Cairo language server dependencies are available.
         Raises RuntimeError with helpful message if dependencies are missing.
         """
-        cairo_info = CairoLanguageServer._check_cairo_available()
+        # The toolchain check and the language server lookup are independent, so the probes run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cairo_info_future = executor.submit(CairoLanguageServer._check_cairo_available)
+            ls_path_future = executor.submit(CairoLanguageServer._get_cairo_ls_path)
+            cairo_info = cairo_info_future.result()
+            ls_path = ls_path_future.result()
+
         if not cairo_info:
             raise RuntimeError(
                 "Cairo toolchain is not installed. Please install Scarb (recommended):\n\n"
@@ -104,9 +101,8 @@ class CairoLanguageServer(SolidLanguageServer):
             )
 
         tool_type, version = cairo_info
-        logger.log(f"{tool_type} version: {version}", logging.INFO)
+        logger.log(f"{tool_type} version: {version}", level=logging.INFO)
 
-        ls_path = CairoLanguageServer._get_cairo_ls_path()
         if not ls_path:
             raise RuntimeError(
                 "cairo-language-server not found.\n\n"
@@ -119,12 +115,21 @@ class CairoLanguageServer(SolidLanguageServer):
             )
 
         if isinstance(ls_path, list):
-            logger.log(f"Using Cairo language server: {' '.join(ls_path)}", logging.INFO)
+            logger.log(f"Using Cairo language server: {' '.join(ls_path)}", level=logging.INFO)
         else:
-            logger.log(f"Using cairo-language-server at: {ls_path}", logging.INFO)
+            logger.log(f"Using cairo-language-server at: {ls_path}", level=logging.INFO)
 
         return ls_path if isinstance(ls_path, list) else [ls_path]
 
+    @staticmethod
+    def _get_required_executables(ls_cmd: list[str]) -> list[str]:
+        """
+        Returns the executables whose presence `_setup_runtime_dependency` established for the given launch command,
+        i.e. the language server's executable and the toolchain found by `_check_cairo_available` (whose probe is cached).
+        """
+        toolchain = "scarb" if probe_command_output("scarb", "--version") is not None else "cairo-compile"
+        return [ls_cmd[0]] if ls_cmd[0] == toolchain else [ls_cmd[0], toolchain]
+
     def __init__(
         self,
         config: LanguageServerConfig,
@@ -136,11 +141,12 @@ class CairoLanguageServer(SolidLanguageServer):
         Use LanguageServer.create() instead.
         """
         logger = LanguageServerLogger("cairo")
-        ls_cmd = self._setup_runtime_dependency(logger)
+        ls_cmd = get_cached_launch_command(
+            solidlsp_settings.solidlsp_dir, "cairo", lambda: self._setup_runtime_dependency(logger), self._get_required_executables
+        )
 
         super().__init__(
             config,
-            logger,
             repository_root_path,
             ProcessLaunchInfo(cmd=ls_cmd, cwd=repository_root_path),
             "cairo",
@@ -159,25 +165,7 @@ class CairoLanguageServer(SolidLanguageServer):
             "locale": "en",
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "symbol": {"dynamicRegistration": True},
-                },
-            },
+            "capabilities": BASIC_CLIENT_CAPABILITIES,
             "workspaceFolders": [
                 {
                     "name": os.path.basename(repository_absolute_path),
@@ -186,40 +174,9 @@ class CairoLanguageServer(SolidLanguageServer):
             ],
         }
 
-    def _start_server(self):
+    def _start_server(self) -> None:
         """Start cairo-language-server process"""
+        start_basic_language_server(self, "Cairo language server", self._get_initialize_params(self.repository_root_path))
 
-        def register_capability_handler(params):
-            return
-
-        def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
-
-        def do_nothing(params):
-            return
-
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-
-        self.logger.log("Starting Cairo language server process", logging.INFO)
-        self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        self.logger.log(
-            "Sending initialize request from LSP client to LSP server and awaiting response",
-            logging.INFO,
-        )
-        init_response = self.server.send.initialize(initialize_params)
-
-        # Verify server capabilities
-        if "textDocumentSync" in init_response.get("capabilities", {}):
-            self.logger.log("Cairo language server initialized successfully", logging.INFO)
-
-        self.server.notify.initialized({})
-        self.completions_available.set()
-
-        # Server is ready after initialization
+        # The server is ready after initialization
         self.server_ready.set()
-        self.server_ready.wait()
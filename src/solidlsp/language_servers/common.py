@@ -3,14 +3,23 @@ from __future__ import annotations
 import logging
 import os
 import platform
+import shutil
 import subprocess
-from collections.abc import Iterable, Mapping, Sequence
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, replace
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from solidlsp.ls_exceptions import SolidLSPException
 from solidlsp.ls_utils import FileUtils, PlatformUtils
+from solidlsp.lsp_protocol_handler.lsp_types import ClientCapabilities, InitializeParams
+from solidlsp.util.cache import load_cache, save_cache
 from solidlsp.util.subprocess_util import subprocess_kwargs
 
+if TYPE_CHECKING:
+    from solidlsp.ls import SolidLanguageServer
+
 log = logging.getLogger(__name__)
 
 
@@ -141,6 +150,273 @@ class RuntimeDependencyCollection:
             FileUtils.download_and_extract_archive(dep.url, target_dir, dep.archive_type or "zip")
 
 
+# Client capabilities for language servers which only need the basic text document and workspace features.
+# Shared by the initialize params of these servers and hence not to be modified.
+BASIC_CLIENT_CAPABILITIES: ClientCapabilities = {
+    "textDocument": {
+        "synchronization": {"didSave": True, "dynamicRegistration": True},
+        "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
+        "definition": {"dynamicRegistration": True, "linkSupport": True},
+        "references": {"dynamicRegistration": True},
+        "documentSymbol": {
+            "dynamicRegistration": True,
+            "hierarchicalDocumentSymbolSupport": True,
+            "symbolKind": {"valueSet": list(range(1, 27))},  # type: ignore[arg-type]
+        },
+        "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},  # type: ignore[list-item]
+    },
+    "workspace": {
+        "workspaceFolders": True,
+        "didChangeConfiguration": {"dynamicRegistration": True},
+        "symbol": {"dynamicRegistration": True},
+    },
+}
+
+
+def _do_nothing(params: Any) -> None:
+    return
+
+
+def _log_window_message(msg: Any) -> None:
+    log.info("LSP: window/logMessage: %s", msg)
+
+
+# handlers of the notifications sent by language servers which require no special handling (see `start_basic_language_server`)
+_BASIC_NOTIFICATION_HANDLERS: dict[str, Callable[[Any], None]] = {
+    "window/logMessage": _log_window_message,
+    "$/progress": _do_nothing,
+    "textDocument/publishDiagnostics": _do_nothing,
+}
+
+
+def start_basic_language_server(
+    language_server: SolidLanguageServer,
+    server_name: str,
+    initialize_params: InitializeParams,
+    require_text_document_sync: bool = False,
+) -> None:
+    """
+    Starts the process of a language server which requires no special handling of the messages it sends,
+    initializes it and signals that completions are available.
+
+    :param language_server: the language server to start
+    :param server_name: the name of the server for log messages, e.g. "Cairo language server"
+    :param initialize_params: the parameters of the initialize request
+    :param require_text_document_sync: whether the server must report textDocumentSync capabilities;
+        if so, a `SolidLSPException` is raised for a server which does not report them, otherwise, a warning is logged
+    """
+    server = language_server.server
+    server.on_request("client/registerCapability", _do_nothing)
+    server.register_notification_handlers(_BASIC_NOTIFICATION_HANDLERS)
+
+    log.info(f"Starting {server_name} process")
+    server.start()
+
+    log.info("Sending initialize request from LSP client to LSP server and awaiting response")
+    init_response = server.send.initialize(initialize_params)
+
+    # Verify server capabilities
+    if "textDocumentSync" in init_response.get("capabilities", {}):
+        log.info(f"{server_name} initialized successfully")
+    elif require_text_document_sync:
+        raise SolidLSPException(f"{server_name} did not report textDocumentSync capabilities")
+    else:
+        log.warning(f"{server_name} does not report textDocumentSync capabilities")
+
+    server.notify.initialized({})
+    language_server.completions_available.set()
+
+
+# outputs of successful tool probes (see `probe_command_output`), by command
+_successful_probe_outputs: dict[tuple[str, ...], str] = {}
+# commands of successful tool probes (see `probe_command`)
+_successful_probes: set[tuple[str, ...]] = set()
+
+
+def probe_command_output(*cmd: str) -> str | None:
+    """
+    Runs the given command (typically a version query) in order to check whether a tool is available.
+
+    Successful probes are cached for the lifetime of the process. Failed probes are not cached,
+    such that a tool which is installed later on is still found.
+
+    :param cmd: the command and its arguments
+    :return: the stripped standard output of the command if it exited with code 0, None otherwise
+    """
+    output = _successful_probe_outputs.get(cmd)
+    if output is not None:
+        return output
+    try:
+        # stderr is not needed, and stdout is only decoded if the probe succeeded
+        result = subprocess.run(list(cmd), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False, **subprocess_kwargs())
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    output = result.stdout.decode(errors="replace").strip()
+    _successful_probe_outputs[cmd] = output
+    return output
+
+
+def probe_command(*cmd: str) -> bool:
+    """
+    Like `probe_command_output`, but for probes which only need to know whether the command succeeds.
+    The output of the command is discarded without being read.
+
+    :param cmd: the command and its arguments
+    :return: whether the command exited with code 0
+    """
+    if cmd in _successful_probes:
+        return True
+    try:
+        result = subprocess.run(list(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, **subprocess_kwargs())
+    except (subprocess.SubprocessError, OSError):
+        return False
+    if result.returncode != 0:
+        return False
+    _successful_probes.add(cmd)
+    return True
+
+
+# paths of executables found by `find_executable`, by name
+_found_executables: dict[str, str] = {}
+
+
+def find_executable(name: str) -> str | None:
+    """
+    Looks up an executable like `shutil.which` does.
+
+    Found executables are cached for the lifetime of the process. Unsuccessful lookups are not cached,
+    such that an executable which is installed later on is still found.
+
+    :param name: the name of the executable (or a path to it)
+    :return: the path of the executable or None if it was not found
+    """
+    path = _found_executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _found_executables[name] = path
+    return path
+
+
+LAUNCH_COMMAND_CACHE_FILENAME = "launch_commands.pkl"
+_LAUNCH_COMMAND_CACHE_VERSION = 2
+# serializes the updates of the launch command cache by language servers which are started in parallel threads
+_launch_command_cache_lock = threading.Lock()
+
+
+def _get_executable_fingerprint(executable: str) -> tuple[str, float] | None:
+    """
+    :param executable: the name of an executable (or a path to it)
+    :return: the path and the modification time of the executable or None if it was not found
+    """
+    path = find_executable(executable)
+    if path is None:
+        return None
+    try:
+        return path, os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _get_required_executable_fingerprints(executables: list[str] | None) -> list[tuple[str, str, float]] | None:
+    """
+    :param executables: the names of executables (or paths to them)
+    :return: the (name, path, modification time) triples of the executables or None if `executables` is None
+        or one of the executables was not found
+    """
+    if executables is None:
+        return None
+    fingerprints = []
+    for executable in executables:
+        fingerprint = _get_executable_fingerprint(executable)
+        if fingerprint is None:
+            return None
+        fingerprints.append((executable, *fingerprint))
+    return fingerprints
+
+
+def _load_launch_command_cache(cache_path: str, cache_version: Any) -> dict[str, tuple[list[str], list[tuple[str, str, float]]]]:
+    if os.path.exists(cache_path):
+        try:
+            return load_cache(cache_path, cache_version) or {}
+        except Exception as e:
+            log.warning(f"Failed to load launch command cache from {cache_path}: {e}")
+    return {}
+
+
+def _save_launch_command_cache(
+    cache_path: str, cache_version: Any, entries: dict[str, tuple[list[str], list[tuple[str, str, float]]]]
+) -> None:
+    """
+    Saves the launch command cache by writing a temporary file in the cache's directory and replacing the cache file
+    with it, such that other processes never read a partially written cache.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=LAUNCH_COMMAND_CACHE_FILENAME, suffix=".tmp")
+        os.close(fd)
+        try:
+            save_cache(tmp_path, cache_version, entries)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except Exception as e:
+        log.warning(f"Failed to save launch command cache to {cache_path}: {e}")
+
+
+def _get_launch_executable(cmd: list[str]) -> list[str]:
+    return [cmd[0]]
+
+
+def get_cached_launch_command(
+    cache_dir: str,
+    server_id: str,
+    determine_launch_command: Callable[[], list[str]],
+    get_required_executables: Callable[[list[str]], list[str] | None] = _get_launch_executable,
+) -> list[str]:
+    """
+    Returns the launch command of a language server whose runtime dependencies are detected by probing the system,
+    persisting the detected command on disk, such that new processes need not repeat the probes.
+
+    A persisted command is only used if the PATH is unchanged and each of the executables the command requires
+    still resolves to the same file with the same modification time; otherwise, the command is determined anew.
+
+    :param cache_dir: the directory in which to store the cache file
+    :param server_id: the identifier of the language server within the cache
+    :param determine_launch_command: the function which determines the launch command by probing the system
+        (raising an exception if runtime dependencies are missing)
+    :param get_required_executables: the function which, given a determined launch command, returns the executables
+        whose presence the probes of `determine_launch_command` established (by default, the command's executable only)
+        or None if the command's validity does not depend on executables alone, in which case it is not persisted
+    :return: the launch command
+    """
+    cache_path = os.path.join(cache_dir, LAUNCH_COMMAND_CACHE_FILENAME)
+    # commands resolved against a different PATH may not be the ones that would be found now
+    cache_version = (_LAUNCH_COMMAND_CACHE_VERSION, os.environ.get("PATH", ""))
+    entry = _load_launch_command_cache(cache_path, cache_version).get(server_id)
+    if entry is not None:
+        cmd, fingerprints = entry
+        if all(_get_executable_fingerprint(executable) == (path, mtime) for executable, path, mtime in fingerprints):
+            log.info(f"Using cached launch command for {server_id}: {' '.join(cmd)}")
+            return cmd
+
+    cmd = determine_launch_command()
+    fingerprints = _get_required_executable_fingerprints(get_required_executables(cmd))
+    with _launch_command_cache_lock:
+        # the cache is read anew, such that entries stored by other servers in the meantime are retained
+        entries = _load_launch_command_cache(cache_path, cache_version)
+        if fingerprints is not None:
+            entries[server_id] = (cmd, fingerprints)
+        elif entries.pop(server_id, None) is None:
+            return cmd
+        _save_launch_command_cache(cache_path, cache_version, entries)
+    return cmd
+
+
 def quote_windows_path(path: str) -> str:
     """
     Quote a path for Windows command execution if needed.
@@ -4,12 +4,18 @@ Provides Move specific instantiation of the LanguageServer class using move-anal
 
 import logging
 import os
-import shutil
-import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from overrides import override
 
+from solidlsp.language_servers.common import (
+    BASIC_CLIENT_CAPABILITIES,
+    find_executable,
+    get_cached_launch_command,
+    probe_command_output,
+    start_basic_language_server,
+)
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_logger import LanguageServerLogger
@@ -38,20 +44,14 @@ class MoveAnalyzer(SolidLanguageServer):
     def _check_move_available():
         """Check if Move CLI is available."""
         # Try aptos CLI first
-        try:
-            result = subprocess.run(["aptos", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return ("aptos", result.stdout.strip())
-        except FileNotFoundError:
-            pass
+        version = probe_command_output("aptos", "--version")
+        if version is not None:
+            return ("aptos", version)
 
         # Try move CLI
-        try:
-            result = subprocess.run(["move", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return ("move", result.stdout.strip())
-        except FileNotFoundError:
-            pass
+        version = probe_command_output("move", "--version")
+        if version is not None:
+            return ("move", version)
 
         return None
 
@@ -59,15 +59,15 @@ class MoveAnalyzer(SolidLanguageServer):
     def _get_move_analyzer_path():
         """Get move-analyzer path."""
         # Try to find move-analyzer in PATH
-        analyzer_path = shutil.which("move-analyzer")
+        analyzer_path = find_executable("move-analyzer")
         if analyzer_path:
             return analyzer_path
 
         # Alternative paths where move-analyzer might be installed
         # For Aptos CLI, it might be in ~/.aptos/bin
-        home = os.path.expanduser("~")
-        aptos_analyzer = os.path.join(home, ".aptos", "bin", "move-analyzer")
-        if os.path.exists(aptos_analyzer):
+        # (looked up like the executables on the PATH, such that a found executable is cached)
+        aptos_analyzer = find_executable(os.path.join(os.path.expanduser("~"), ".aptos", "bin", "move-analyzer"))
+        if aptos_analyzer:
             return aptos_analyzer
 
         return None
@@ -78,7 +78,13 @@ class MoveAnalyzer(SolidLanguageServer):
         Check if required Move analyzer dependencies are available.
         Raises RuntimeError with helpful message if dependencies are missing.
         """
-        move_info = MoveAnalyzer._check_move_available()
+        # The CLI check and the analyzer lookup are independent, so the probes run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            move_info_future = executor.submit(MoveAnalyzer._check_move_available)
+            analyzer_path_future = executor.submit(MoveAnalyzer._get_move_analyzer_path)
+            move_info = move_info_future.result()
+            analyzer_path = analyzer_path_future.result()
+
         if not move_info:
             raise RuntimeError(
                 "Move CLI or Aptos CLI is not installed. Please install one of:\n\n"
@@ -89,9 +95,8 @@ class MoveAnalyzer(SolidLanguageServer):
             )
 
         cli_type, version = move_info
-        logger.log(f"{cli_type} version: {version}", logging.INFO)
+        logger.log(f"{cli_type} version: {version}", level=logging.INFO)
 
-        analyzer_path = MoveAnalyzer._get_move_analyzer_path()
         if not analyzer_path:
             raise RuntimeError(
                 "move-analyzer not found.\n\n"
@@ -100,8 +105,17 @@ class MoveAnalyzer(SolidLanguageServer):
                 "Make sure the binary is in your PATH or in ~/.aptos/bin/"
             )
 
-        logger.log(f"Using move-analyzer at: {analyzer_path}", logging.INFO)
-        return analyzer_path
+        logger.log(f"Using move-analyzer at: {analyzer_path}", level=logging.INFO)
+        return [analyzer_path]
+
+    @staticmethod
+    def _get_required_executables(ls_cmd: list[str]) -> list[str]:
+        """
+        Returns the executables whose presence `_setup_runtime_dependency` established for the given launch command,
+        i.e. the analyzer's executable and the CLI found by `_check_move_available` (whose probe is cached).
+        """
+        cli = "aptos" if probe_command_output("aptos", "--version") is not None else "move"
+        return [ls_cmd[0], cli]
 
     def __init__(
         self,
@@ -114,15 +128,17 @@ class MoveAnalyzer(SolidLanguageServer):
         Use LanguageServer.create() instead.
         """
         logger = LanguageServerLogger("move")
-        ls_cmd = self._setup_runtime_dependency(logger)
+        ls_cmd = get_cached_launch_command(
+            solidlsp_settings.solidlsp_dir, "move", lambda: self._setup_runtime_dependency(logger), self._get_required_executables
+        )
         super().__init__(
             config,
-            logger,
             repository_root_path,
             ProcessLaunchInfo(cmd=ls_cmd, cwd=repository_root_path),
             "move",
             solidlsp_settings,
         )
+        self.server_ready = threading.Event()
 
     @staticmethod
     def _get_initialize_params(repository_absolute_path: str) -> InitializeParams:
@@ -135,25 +151,7 @@ class MoveAnalyzer(SolidLanguageServer):
             "locale": "en",
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "symbol": {"dynamicRegistration": True},
-                },
-            },
+            "capabilities": BASIC_CLIENT_CAPABILITIES,
             "workspaceFolders": [
                 {
                     "name": os.path.basename(repository_absolute_path),
@@ -162,40 +160,9 @@ class MoveAnalyzer(SolidLanguageServer):
             ],
         }
 
-    def _start_server(self):
+    def _start_server(self) -> None:
         """Start move-analyzer server process"""
+        start_basic_language_server(self, "Move analyzer", self._get_initialize_params(self.repository_root_path))
 
-        def register_capability_handler(params):
-            return
-
-        def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
-
-        def do_nothing(params):
-            return
-
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-
-        self.logger.log("Starting Move analyzer process", logging.INFO)
-        self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        self.logger.log(
-            "Sending initialize request from LSP client to LSP server and awaiting response",
-            logging.INFO,
-        )
-        init_response = self.server.send.initialize(initialize_params)
-
-        # Verify server capabilities
-        if "textDocumentSync" in init_response.get("capabilities", {}):
-            self.logger.log("Move analyzer initialized successfully", logging.INFO)
-
-        self.server.notify.initialized({})
-        self.completions_available.set()
-
-        # Server is ready after initialization
+        # The server is ready after initialization
         self.server_ready.set()
-        self.server_ready.wait()
@@ -4,12 +4,17 @@ Provides Solidity specific instantiation of the LanguageServer class using solid
 
 import logging
 import os
-import shutil
-import subprocess
 import threading
 
 from overrides import override
 
+from solidlsp.language_servers.common import (
+    BASIC_CLIENT_CAPABILITIES,
+    find_executable,
+    get_cached_launch_command,
+    probe_command_output,
+    start_basic_language_server,
+)
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_utils import PathUtils
@@ -40,40 +45,44 @@ class SolidityLanguageServer(SolidLanguageServer):
     @staticmethod
     def _check_node_available():
         """Check if Node.js is available."""
-        try:
-            result = subprocess.run(["node", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except FileNotFoundError:
-            return None
-        return None
+        return probe_command_output("node", "--version")
 
     @staticmethod
     def _check_npm_available():
         """Check if npm is available."""
-        try:
-            result = subprocess.run(["npm", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except FileNotFoundError:
-            return None
-        return None
+        return probe_command_output("npm", "--version")
 
     @staticmethod
     def _get_solidity_ls_path():
         """Get solidity-language-server path from npx or global installation."""
         # Try npx first (recommended)
-        npx_path = shutil.which("npx")
+        npx_path = find_executable("npx")
         if npx_path:
             return ["npx", "--yes", "@nomicfoundation/solidity-language-server", "--stdio"]
 
         # Fallback to global installation
-        ls_path = shutil.which("nomicfoundation-solidity-language-server")
+        ls_path = find_executable("nomicfoundation-solidity-language-server")
         if ls_path:
             return [ls_path, "--stdio"]
 
         return None
 
+    @staticmethod
+    def _setup_runtime_dependency() -> list[str]:
+        """
+        Determines the command with which to launch the Solidity language server.
+        Raises RuntimeError with helpful message if the server is not available.
+        """
+        ls_cmd = SolidityLanguageServer._get_solidity_ls_path()
+        if not ls_cmd:
+            raise RuntimeError(
+                "Solidity language server not found.\n"
+                "Please install it globally with:\n"
+                "  npm install -g @nomicfoundation/solidity-language-server\n\n"
+                "Or ensure 'npx' is available (comes with npm 5.2+) to use the server automatically."
+            )
+        return ls_cmd
+
     def __init__(
         self,
         config: LanguageServerConfig,
@@ -84,14 +93,7 @@ class SolidityLanguageServer(SolidLanguageServer):
         Creates a SolidityLanguageServer instance. This class is not meant to be instantiated directly.
         Use LanguageServer.create() instead.
         """
-        ls_cmd = self._get_solidity_ls_path()
-        if not ls_cmd:
-            raise RuntimeError(
-                "Solidity language server not found.\n"
-                "Please install it globally with:\n"
-                "  npm install -g @nomicfoundation/solidity-language-server\n\n"
-                "Or ensure 'npx' is available (comes with npm 5.2+) to use the server automatically."
-            )
+        ls_cmd = get_cached_launch_command(solidlsp_settings.solidlsp_dir, "solidity", self._setup_runtime_dependency)
 
         super().__init__(
             config,
@@ -113,25 +115,7 @@ class SolidityLanguageServer(SolidLanguageServer):
             "locale": "en",
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "symbol": {"dynamicRegistration": True},
-                },
-            },
+            "capabilities": BASIC_CLIENT_CAPABILITIES,
             "workspaceFolders": [
                 {
                     "name": os.path.basename(repository_absolute_path),
@@ -140,36 +124,11 @@ class SolidityLanguageServer(SolidLanguageServer):
             ],
         }
 
-    def _start_server(self):
+    def _start_server(self) -> None:
         """Start solidity-language-server process"""
+        start_basic_language_server(
+            self, "Solidity language server", self._get_initialize_params(self.repository_root_path), require_text_document_sync=True
+        )
 
-        def register_capability_handler(params):
-            return
-
-        def window_log_message(msg):
-            log.info(f"LSP: window/logMessage: {msg}")
-
-        def do_nothing(params):
-            return
-
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-
-        log.info("Starting Solidity language server process")
-        self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        log.info("Sending initialize request from LSP client to LSP server and awaiting response")
-        init_response = self.server.send.initialize(initialize_params)
-
-        # Verify server capabilities
-        assert "textDocumentSync" in init_response["capabilities"]
-
-        self.server.notify.initialized({})
-        self.completions_available.set()
-
-        # Solidity language server is typically ready immediately after initialization
+        # The server is ready after initialization
         self.server_ready.set()
-        self.server_ready.wait()
@@ -4,12 +4,18 @@ Provides Sui Move specific instantiation of the LanguageServer class using sui-m
 
 import logging
 import os
-import shutil
-import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from overrides import override
 
+from solidlsp.language_servers.common import (
+    BASIC_CLIENT_CAPABILITIES,
+    find_executable,
+    get_cached_launch_command,
+    probe_command_output,
+    start_basic_language_server,
+)
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_logger import LanguageServerLogger
@@ -18,6 +24,8 @@ from solidlsp.lsp_protocol_handler.lsp_types import InitializeParams
 from solidlsp.lsp_protocol_handler.server import ProcessLaunchInfo
 from solidlsp.settings import SolidLSPSettings
 
+_SUI_MOVE_IGNORED_DIRNAMES = frozenset({"build", "target", ".sui"})
+
 
 class SuiMoveAnalyzer(SolidLanguageServer):
     """
@@ -27,53 +35,32 @@ class SuiMoveAnalyzer(SolidLanguageServer):
     @override
     def is_ignored_dirname(self, dirname: str) -> bool:
         # Ignore common Sui Move build/dependency directories
-        return super().is_ignored_dirname(dirname) or dirname in [
-            "build",
-            "target",
-            ".sui",
-        ]
+        return super().is_ignored_dirname(dirname) or dirname in _SUI_MOVE_IGNORED_DIRNAMES
 
     @staticmethod
     def _check_sui_available():
         """Check if Sui CLI is available."""
-        try:
-            result = subprocess.run(["sui", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except FileNotFoundError:
-            return None
-        return None
+        return probe_command_output("sui", "--version")
 
     @staticmethod
     def _get_sui_move_analyzer_path():
         """Get sui-move-analyzer path."""
         # Try to find sui-move-analyzer in PATH
-        analyzer_path = shutil.which("sui-move-analyzer")
+        analyzer_path = find_executable("sui-move-analyzer")
         if analyzer_path:
             return analyzer_path
 
-        # Try as sui subcommand
-        sui_path = shutil.which("sui")
-        if sui_path:
-            # Check if 'sui move-analyzer' command exists
-            try:
-                result = subprocess.run(
-                    ["sui", "move-analyzer", "--help"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    return ["sui", "move-analyzer"]
-            except (subprocess.SubprocessError, FileNotFoundError, OSError):
-                pass
-
         # Alternative: look in ~/.sui/bin
-        home = os.path.expanduser("~")
-        sui_analyzer = os.path.join(home, ".sui", "bin", "sui-move-analyzer")
-        if os.path.exists(sui_analyzer):
+        sui_analyzer = os.path.join(os.path.expanduser("~"), ".sui", "bin", "sui-move-analyzer")
+        if os.path.isfile(sui_analyzer):
             return sui_analyzer
 
+        # Try as sui subcommand, detected from the subcommands listed in the (cached) help of the Sui CLI
+        if find_executable("sui"):
+            sui_help = probe_command_output("sui", "--help")
+            if sui_help is not None and "move-analyzer" in sui_help:
+                return ["sui", "move-analyzer"]
+
         return None
 
     @staticmethod
@@ -82,7 +69,13 @@ class SuiMoveAnalyzer(SolidLanguageServer):
         Check if required Sui Move analyzer dependencies are available.
         Raises RuntimeError with helpful message if dependencies are missing.
         """
-        sui_version = SuiMoveAnalyzer._check_sui_available()
+        # The toolchain check and the language server lookup are independent, so the probes run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sui_version_future = executor.submit(SuiMoveAnalyzer._check_sui_available)
+            analyzer_path_future = executor.submit(SuiMoveAnalyzer._get_sui_move_analyzer_path)
+            sui_version = sui_version_future.result()
+            analyzer_path = analyzer_path_future.result()
+
         if not sui_version:
             raise RuntimeError(
                 "Sui CLI is not installed. Please install Sui:\n\n"
@@ -93,9 +86,8 @@ class SuiMoveAnalyzer(SolidLanguageServer):
                 "Make sure the Sui binary is in your PATH."
             )
 
-        logger.log(f"Sui version: {sui_version}", logging.INFO)
+        logger.log("Sui version: %s", sui_version, level=logging.INFO)
 
-        analyzer_path = SuiMoveAnalyzer._get_sui_move_analyzer_path()
         if not analyzer_path:
             raise RuntimeError(
                 "sui-move-analyzer not found.\n\n"
@@ -107,12 +99,20 @@ class SuiMoveAnalyzer(SolidLanguageServer):
             )
 
         if isinstance(analyzer_path, list):
-            logger.log(f"Using Sui Move analyzer: {' '.join(analyzer_path)}", logging.INFO)
+            logger.log(f"Using Sui Move analyzer: {' '.join(analyzer_path)}", level=logging.INFO)
         else:
-            logger.log(f"Using sui-move-analyzer at: {analyzer_path}", logging.INFO)
+            logger.log(f"Using sui-move-analyzer at: {analyzer_path}", level=logging.INFO)
 
         return analyzer_path if isinstance(analyzer_path, list) else [analyzer_path]
 
+    @staticmethod
+    def _get_required_executables(analyzer_cmd: list[str]) -> list[str]:
+        """
+        Returns the executables whose presence `_setup_runtime_dependency` established for the given launch command.
+        The availability of the analyzer as a subcommand of the Sui CLI is determined by the Sui executable.
+        """
+        return ["sui"] if analyzer_cmd[0] == "sui" else [analyzer_cmd[0], "sui"]
+
     def __init__(
         self,
         config: LanguageServerConfig,
@@ -124,11 +124,12 @@ class SuiMoveAnalyzer(SolidLanguageServer):
         Use LanguageServer.create() instead.
         """
         logger = LanguageServerLogger("sui_move")
-        analyzer_cmd = self._setup_runtime_dependency(logger)
+        analyzer_cmd = get_cached_launch_command(
+            solidlsp_settings.solidlsp_dir, "sui_move", lambda: self._setup_runtime_dependency(logger), self._get_required_executables
+        )
 
         super().__init__(
             config,
-            logger,
             repository_root_path,
             ProcessLaunchInfo(cmd=analyzer_cmd, cwd=repository_root_path),
             "sui_move",
@@ -147,25 +148,7 @@ class SuiMoveAnalyzer(SolidLanguageServer):
             "locale": "en",
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "symbol": {"dynamicRegistration": True},
-                },
-            },
+            "capabilities": BASIC_CLIENT_CAPABILITIES,
             "workspaceFolders": [
                 {
                     "name": os.path.basename(repository_absolute_path),
@@ -174,40 +157,9 @@ class SuiMoveAnalyzer(SolidLanguageServer):
             ],
         }
 
-    def _start_server(self):
+    def _start_server(self) -> None:
         """Start sui-move-analyzer server process"""
+        start_basic_language_server(self, "Sui Move analyzer", self._get_initialize_params(self.repository_root_path))
 
-        def register_capability_handler(params):
-            return
-
-        def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
-
-        def do_nothing(params):
-            return
-
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-
-        self.logger.log("Starting Sui Move analyzer process", logging.INFO)
-        self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        self.logger.log(
-            "Sending initialize request from LSP client to LSP server and awaiting response",
-            logging.INFO,
-        )
-        init_response = self.server.send.initialize(initialize_params)
-
-        # Verify server capabilities
-        if "textDocumentSync" in init_response.get("capabilities", {}):
-            self.logger.log("Sui Move analyzer initialized successfully", logging.INFO)
-
-        self.server.notify.initialized({})
-        self.completions_available.set()
-
-        # Server is ready after initialization
+        # The server is ready after initialization
         self.server_ready.set()
-        self.server_ready.wait()
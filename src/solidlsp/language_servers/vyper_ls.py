@@ -4,20 +4,47 @@ Provides Vyper specific instantiation of the LanguageServer class.
 
 import logging
 import os
-import shutil
-import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from overrides import override
 
+from solidlsp.language_servers.common import (
+    find_executable,
+    get_cached_launch_command,
+    probe_command,
+    probe_command_output,
+    start_basic_language_server,
+)
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_logger import LanguageServerLogger
 from solidlsp.ls_utils import PathUtils
-from solidlsp.lsp_protocol_handler.lsp_types import InitializeParams
+from solidlsp.lsp_protocol_handler.lsp_types import ClientCapabilities, InitializeParams
 from solidlsp.lsp_protocol_handler.server import ProcessLaunchInfo
 from solidlsp.settings import SolidLSPSettings
 
+_VYPER_IGNORED_DIRNAMES = frozenset({"__pycache__", "build", "out", ".pytest_cache"})
+
+# The client capabilities declared to vyper-lsp, which (unlike `BASIC_CLIENT_CAPABILITIES`) include no references, hover
+# or workspace symbol support. Shared by the initialize params and hence not to be modified.
+_VYPER_CLIENT_CAPABILITIES: ClientCapabilities = {
+    "textDocument": {
+        "synchronization": {"didSave": True, "dynamicRegistration": True},
+        "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
+        "definition": {"dynamicRegistration": True, "linkSupport": True},
+        "documentSymbol": {
+            "dynamicRegistration": True,
+            "hierarchicalDocumentSymbolSupport": True,
+            "symbolKind": {"valueSet": list(range(1, 27))},  # type: ignore[arg-type]
+        },
+    },
+    "workspace": {
+        "workspaceFolders": True,
+        "didChangeConfiguration": {"dynamicRegistration": True},
+    },
+}
+
 
 class VyperLanguageServer(SolidLanguageServer):
     """
@@ -28,47 +55,26 @@ class VyperLanguageServer(SolidLanguageServer):
     @override
     def is_ignored_dirname(self, dirname: str) -> bool:
         # Ignore common Vyper build/dependency directories
-        return super().is_ignored_dirname(dirname) or dirname in [
-            "__pycache__",
-            "build",
-            "out",
-            ".pytest_cache",
-        ]
+        return super().is_ignored_dirname(dirname) or dirname in _VYPER_IGNORED_DIRNAMES
 
     @staticmethod
     def _check_vyper_available():
         """Check if Vyper compiler is available."""
-        try:
-            result = subprocess.run(["vyper", "--version"], capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except FileNotFoundError:
-            return None
-        return None
+        return probe_command_output("vyper", "--version")
 
     @staticmethod
     def _get_vyper_lsp_path():
         """Get vyper-lsp path."""
         # Try to find vyper-lsp in PATH
-        lsp_path = shutil.which("vyper-lsp")
+        lsp_path = find_executable("vyper-lsp")
         if lsp_path:
             return lsp_path
 
         # Alternative: python -m vyper_lsp
-        python_path = shutil.which("python3") or shutil.which("python")
-        if python_path:
-            # Check if vyper_lsp module is available
-            try:
-                result = subprocess.run(
-                    [python_path, "-c", "import vyper_lsp"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    return [python_path, "-m", "vyper_lsp"]
-            except (subprocess.SubprocessError, FileNotFoundError, OSError):
-                pass
+        python_path = find_executable("python3") or find_executable("python")
+        # Check if vyper_lsp module is available
+        if python_path and probe_command(python_path, "-c", "import vyper_lsp"):
+            return [python_path, "-m", "vyper_lsp"]
 
         return None
 
@@ -78,7 +84,13 @@ class VyperLanguageServer(SolidLanguageServer):
         Check if required Vyper language server dependencies are available.
         Raises RuntimeError with helpful message if dependencies are missing.
         """
-        vyper_version = VyperLanguageServer._check_vyper_available()
+        # The toolchain check and the language server lookup are independent, so the probes run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vyper_version_future = executor.submit(VyperLanguageServer._check_vyper_available)
+            ls_cmd_future = executor.submit(VyperLanguageServer._get_vyper_lsp_path)
+            vyper_version = vyper_version_future.result()
+            ls_cmd = ls_cmd_future.result()
+
         if not vyper_version:
             raise RuntimeError(
                 "Vyper compiler is not installed. Please install Vyper:\n"
@@ -86,9 +98,8 @@ class VyperLanguageServer(SolidLanguageServer):
                 "See https://docs.vyperlang.org/en/stable/installing-vyper.html for more information."
             )
 
-        logger.log(f"Vyper version: {vyper_version}", logging.INFO)
+        logger.log("Vyper version: %s", vyper_version, level=logging.INFO)
 
-        ls_cmd = VyperLanguageServer._get_vyper_lsp_path()
         if not ls_cmd:
             raise RuntimeError(
                 "Vyper language server not found.\n"
@@ -97,9 +108,19 @@ class VyperLanguageServer(SolidLanguageServer):
                 "Note: Vyper LSP support may be limited or under development."
             )
 
-        logger.log(f"Using Vyper language server: {ls_cmd if isinstance(ls_cmd, str) else ' '.join(ls_cmd)}", logging.INFO)
+        logger.log(f"Using Vyper language server: {ls_cmd if isinstance(ls_cmd, str) else ' '.join(ls_cmd)}", level=logging.INFO)
         return ls_cmd if isinstance(ls_cmd, list) else [ls_cmd]
 
+    @staticmethod
+    def _get_required_executables(ls_cmd: list[str]) -> list[str] | None:
+        """
+        Returns the executables whose presence `_setup_runtime_dependency` established for the given launch command.
+        For the vyper_lsp module launched via Python, the module's availability cannot be told from executables.
+        """
+        if ls_cmd[1:] == ["-m", "vyper_lsp"]:
+            return None
+        return [ls_cmd[0], "vyper"]
+
     def __init__(
         self,
         config: LanguageServerConfig,
@@ -111,11 +132,12 @@ class VyperLanguageServer(SolidLanguageServer):
         Use LanguageServer.create() instead.
         """
         logger = LanguageServerLogger("vyper")
-        ls_cmd = self._setup_runtime_dependency(logger)
+        ls_cmd = get_cached_launch_command(
+            solidlsp_settings.solidlsp_dir, "vyper", lambda: self._setup_runtime_dependency(logger), self._get_required_executables
+        )
 
         super().__init__(
             config,
-            logger,
             repository_root_path,
             ProcessLaunchInfo(cmd=ls_cmd, cwd=repository_root_path),
             "vyper",
@@ -134,22 +156,7 @@ class VyperLanguageServer(SolidLanguageServer):
             "locale": "en",
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {"dynamicRegistration": True, "completionItem": {"snippetSupport": True}},
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                    },
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                },
-            },
+            "capabilities": _VYPER_CLIENT_CAPABILITIES,
             "workspaceFolders": [
                 {
                     "name": os.path.basename(repository_absolute_path),
@@ -158,40 +165,9 @@ class VyperLanguageServer(SolidLanguageServer):
             ],
         }
 
-    def _start_server(self):
+    def _start_server(self) -> None:
         """Start vyper-lsp server process"""
+        start_basic_language_server(self, "Vyper language server", self._get_initialize_params(self.repository_root_path))
 
-        def register_capability_handler(params):
-            return
-
-        def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
-
-        def do_nothing(params):
-            return
-
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-
-        self.logger.log("Starting Vyper language server process", logging.INFO)
-        self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        self.logger.log(
-            "Sending initialize request from LSP client to LSP server and awaiting response",
-            logging.INFO,
-        )
-        init_response = self.server.send.initialize(initialize_params)
-
-        # Verify server capabilities if available
-        if "textDocumentSync" in init_response.get("capabilities", {}):
-            self.logger.log("Vyper language server initialized successfully", logging.INFO)
-
-        self.server.notify.initialized({})
-        self.completions_available.set()
-
-        # Server is ready after initialization
+        # The server is ready after initialization
         self.server_ready.set()
-        self.server_ready.wait()
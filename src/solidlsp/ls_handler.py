@@ -6,7 +6,7 @@ import platform
 import subprocess
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from queue import Empty, Queue
 from typing import Any
@@ -516,6 +516,13 @@ class SolidLanguageServerHandler:
         """
         self.on_notification_handlers[method] = cb
 
+    def register_notification_handlers(self, handlers: Mapping[str, Callable[[Any], None]]) -> None:
+        """
+        Register the callback functions to handle notifications from the server to the client,
+        as a mapping from method to callback function
+        """
+        self.on_notification_handlers.update(handlers)
+
     def _response_handler(self, response: StringDict) -> None:
         """
         Handle the response received from the server for a request, using the id to determine the request
@@ -3,6 +3,7 @@ Language Server Logger implementation for solidlsp.
 """
 
 import logging
+from typing import Any
 
 
 class LanguageServerLogger:
@@ -13,11 +14,13 @@ class LanguageServerLogger:
     def __init__(self, name: str = "LanguageServer"):
         self.logger = logging.getLogger(name)
 
-    def log(self, message: str, level: int = logging.INFO) -> None:
+    def log(self, message: str, *args: Any, level: int = logging.INFO) -> None:
         """
         Log a message with the specified level.
-        
-        :param message: The message to log
+
+        :param message: The message to log, which may contain %-style placeholders for `args`
+        :param args: The arguments to merge into the message, which is only formatted if the level is enabled
         :param level: The logging level
         """
-        self.logger.log(level, message)
\ No newline at end of file
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, message, *args)